@@ -2,8 +2,9 @@
 API endpoints for analytics and system metrics.
 """
 
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc, and_
@@ -14,6 +15,11 @@ from app.models.campaign import Campaign
 
 router = APIRouter()
 
+# Last system health report and when it was built (monotonic seconds); bursts
+# of health polling within the TTL are answered without querying the database
+_SYSTEM_HEALTH_TTL_SECONDS = 5.0
+_system_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
 
 @router.get("/dashboard")
 async def get_dashboard_metrics(
@@ -139,32 +145,32 @@ async def get_trends_performance(
     result = await db.execute(category_query)
     categories_data = result.all()
     
-    # Trends by platform
-    platform_query = select(Trend).where(Trend.created_at >= cutoff_date)
-    result = await db.execute(platform_query)
-    trends = result.scalars().all()
+    # Trends by platform, counted in the database
+    platforms = select(
+        func.unnest(Trend.platforms).label('platform')
+    ).where(Trend.created_at >= cutoff_date).subquery()
+    platform_query = select(
+        platforms.c.platform,
+        func.count().label('count')
+    ).group_by(platforms.c.platform).order_by(desc('count'))
     
-    platform_counts = {}
-    for trend in trends:
-        for platform in trend.platforms:
-            platform_counts[platform] = platform_counts.get(platform, 0) + 1
+    result = await db.execute(platform_query)
+    platform_counts = {row.platform: row.count for row in result}
     
-    # Score distribution
-    score_ranges = {
-        "0.0-0.2": 0, "0.2-0.4": 0, "0.4-0.6": 0, "0.6-0.8": 0, "0.8-1.0": 0
-    }
+    # Score distribution, one filtered count per range
+    score_ranges_query = select(
+        func.count().filter(Trend.score < 0.2),
+        func.count().filter(and_(Trend.score >= 0.2, Trend.score < 0.4)),
+        func.count().filter(and_(Trend.score >= 0.4, Trend.score < 0.6)),
+        func.count().filter(and_(Trend.score >= 0.6, Trend.score < 0.8)),
+        func.count().filter(Trend.score >= 0.8)
+    ).where(Trend.created_at >= cutoff_date)
     
-    for trend in trends:
-        if trend.score < 0.2:
-            score_ranges["0.0-0.2"] += 1
-        elif trend.score < 0.4:
-            score_ranges["0.2-0.4"] += 1
-        elif trend.score < 0.6:
-            score_ranges["0.4-0.6"] += 1
-        elif trend.score < 0.8:
-            score_ranges["0.6-0.8"] += 1
-        else:
-            score_ranges["0.8-1.0"] += 1
+    result = await db.execute(score_ranges_query)
+    score_ranges = dict(zip(
+        ["0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0"],
+        result.one()
+    ))
     
     return {
         "period_days": days,
@@ -179,7 +185,7 @@ async def get_trends_performance(
         ],
         "platforms": [
             {"platform": platform, "count": count}
-            for platform, count in sorted(platform_counts.items(), key=lambda x: x[1], reverse=True)
+            for platform, count in platform_counts.items()
         ],
         "score_distribution": score_ranges
     }
@@ -281,24 +287,34 @@ async def get_system_health(
     Returns:
         Dictionary with system health information
     """
+    global _system_health_cache
+    if _system_health_cache is not None:
+        cached_at, cached_health = _system_health_cache
+        if time.monotonic() - cached_at < _SYSTEM_HEALTH_TTL_SECONDS:
+            return cached_health
+    
     # Check database connectivity and recent activity
     now = datetime.utcnow()
     last_24h = now - timedelta(hours=24)
     
-    # Recent trends and campaigns
+    # Recent trends and campaigns, and unanalyzed trends: one round trip,
+    # each count still served by its own index
     recent_trends_query = select(func.count(Trend.id)).where(Trend.created_at >= last_24h)
     recent_campaigns_query = select(func.count(Campaign.id)).where(Campaign.created_at >= last_24h)
-    
-    recent_trends = await db.scalar(recent_trends_query) or 0
-    recent_campaigns = await db.scalar(recent_campaigns_query) or 0
-    
-    # Unanalyzed trends
     unanalyzed_query = select(func.count(Trend.id)).where(
         and_(Trend.is_analyzed == False, Trend.status == "active")
     )
-    unanalyzed_trends = await db.scalar(unanalyzed_query) or 0
     
-    return {
+    result = await db.execute(
+        select(
+            recent_trends_query.scalar_subquery(),
+            recent_campaigns_query.scalar_subquery(),
+            unanalyzed_query.scalar_subquery()
+        )
+    )
+    recent_trends, recent_campaigns, unanalyzed_trends = (count or 0 for count in result.one())
+    
+    health = {
         "timestamp": now.isoformat(),
         "database": {
             "status": "healthy",
@@ -311,4 +327,6 @@ async def get_system_health(
             "unanalyzed_trends": unanalyzed_trends
         },
         "status": "healthy" if unanalyzed_trends < 100 else "warning"
-    } 
\ No newline at end of file
+    }
+    _system_health_cache = (time.monotonic(), health)
+    return health 
\ No newline at end of file
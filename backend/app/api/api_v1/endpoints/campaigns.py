@@ -11,7 +11,6 @@ from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_database
 from app.models.campaign import Campaign
-from app.models.trend import Trend
 
 router = APIRouter()
 
@@ -0,0 +1,35 @@
+"""
+Shared Redis cache client.
+"""
+
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """
+    Get the shared async Redis client.
+
+    The client is created on first use; redis-py pools the underlying
+    connections, so one client serves every caller in the process.
+
+    Returns:
+        Async Redis client
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client and its connection pool."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
@@ -59,6 +59,7 @@ class Settings(BaseSettings):
     REDDIT_SUBREDDITS: List[str] = ["all", "news", "worldnews", "technology", "entertainment", "business", "science"]
     REDDIT_POSTS_PER_SUBREDDIT: int = 5
     REDDIT_TRENDING_ALGORITHM: str = "hot"  # hot, top, rising, new
+    REDDIT_MAX_CONCURRENCY: int = 4  # Concurrent subreddit fetches, keeps within Reddit's rate limit
     
     # Content Categorization Configuration
     AI_CATEGORIZATION_ENABLED: bool = True
@@ -108,6 +109,47 @@ REQUIRED RESPONSE FORMAT (JSON):
     "pr_suitability": "Brief assessment of PR campaign suitability"
 }}
 
+Respond only with valid JSON.
+"""
+    
+    # Posts sent per batched categorization prompt
+    AI_CATEGORIZATION_BATCH_SIZE: int = 10
+    
+    AI_CATEGORIZATION_BATCH_PROMPT_TEMPLATE: str = """
+Analyze each of these {count} Reddit posts for brand safety and categorization:
+
+CONTENT TO ANALYZE:
+{items}
+
+CATEGORIZATION TASK:
+Categorize each post for brand safety with these levels:
+- SAFE: Brand-safe, suitable for PR campaigns (technology, science, entertainment, lifestyle)
+- CAUTION: Potentially sensitive but not necessarily unsafe (health topics, minor controversies)  
+- POLITICAL: Political content that brands should avoid
+- VIOLENT: Violence, crime, war content
+- CONTROVERSIAL: Highly divisive topics
+- NSFW: Adult/inappropriate content
+
+ANALYSIS CRITERIA:
+1. Context and nuance matter - look beyond keywords
+2. Consider if a major brand would associate with this content
+3. Assess potential for backlash or controversy
+4. Science, technology, entertainment are typically safe
+5. News can be safe unless political/violent
+6. Personal stories and advice are often safe
+
+REQUIRED RESPONSE FORMAT (JSON array with exactly {count} objects, in post order):
+[
+    {{
+        "safety_level": "SAFE|CAUTION|POLITICAL|VIOLENT|CONTROVERSIAL|NSFW",
+        "confidence": 0.85,
+        "primary_category": "technology|science|entertainment|news|lifestyle|politics|violence|controversy",
+        "secondary_categories": ["specific", "subcategories"],
+        "reasoning": "Brief explanation of the categorization decision",
+        "pr_suitability": "Brief assessment of PR campaign suitability"
+    }}
+]
+
 Respond only with valid JSON.
 """
     
@@ -167,6 +209,7 @@ Respond only with valid JSON.
     MIN_TREND_SCORE: float = 0.3
     MAX_TRENDS_PER_DAY: int = 50
     TREND_ANALYSIS_SCHEDULE: str = "0 6 * * *"  # Every day at 6 AM
+    TREND_DEDUP_SIMILARITY_THRESHOLD: float = 0.6  # pg_trgm similarity for matching a new title to an existing trend
     
     # Campaign Generation Configuration
     MAX_ANGLES_PER_TREND: int = 5
@@ -175,10 +218,13 @@ Respond only with valid JSON.
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 100
     RATE_LIMIT_PER_HOUR: int = 1000
+    TREND_SOURCE_MAX_CONCURRENCY: int = 8  # Trend sources collected at once by the daily analysis
     
     # Cache Configuration
     CACHE_TTL_SECONDS: int = 3600
     TREND_CACHE_TTL_SECONDS: int = 86400
+    AI_CATEGORIZATION_CACHE_TTL_SECONDS: int = 86400
+    AI_RESPONSE_CACHE_TTL_SECONDS: int = 86400  # Cached trend sustainability analyses and campaign ideas
     
     # AI Model Configuration
     DEFAULT_AI_PROVIDER: str = "openrouter"  # openai, anthropic, or openrouter
@@ -188,6 +234,7 @@ Respond only with valid JSON.
     ANTHROPIC_MODEL: str = "claude-3-5-sonnet-20241022"  # For direct Anthropic usage
     MAX_TOKENS_PER_REQUEST: int = 2000
     AI_TEMPERATURE: float = 0.7
+    AI_MAX_CONCURRENCY: int = 8  # Trends analyzed at once, keeps within provider rate limits
     
     # Data Collection Settings
     MAX_TRENDS_PER_SOURCE: int = 50
@@ -2,6 +2,7 @@
 Database configuration and session management.
 """
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 import structlog
@@ -15,6 +16,10 @@ engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.ENVIRONMENT == "development",
     future=True,
+    pool_size=10,  # One process-wide pool, shared by every task on the worker's event loop
+    pool_pre_ping=True,  # Workers sit idle for hours between scheduled runs
+    pool_recycle=1800,
+    query_cache_size=1200,  # Compiled statement cache, room for every task and endpoint query
 )
 
 # Create async session factory
@@ -28,10 +33,36 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+# create_all only creates missing tables, so columns and indexes added to an
+# existing table are applied here. Every statement must be idempotent.
+_SCHEMA_UPGRADES = (
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS pr_potential_score FLOAT",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS viral_potential_score FLOAT",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS brand_safety_score FLOAT",
+    "CREATE INDEX IF NOT EXISTS ix_trends_pr_potential_score ON trends (pr_potential_score)",
+    "CREATE INDEX IF NOT EXISTS ix_trends_viral_potential_score ON trends (viral_potential_score)",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS related_news_count INTEGER",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS volume_change_24h FLOAT",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS volume_change_7d FLOAT",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS positive_pct FLOAT",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS negative_pct FLOAT",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS age_groups_count INTEGER",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS countries_count INTEGER",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS opportunity_score FLOAT",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS emotional_indicators VARCHAR[]",
+    "ALTER TABLE trends ADD COLUMN IF NOT EXISTS risk_factors VARCHAR[]",
+    "CREATE INDEX IF NOT EXISTS ix_trends_title_trgm ON trends USING gin (title gin_trgm_ops)",
+)
+
+
 async def create_tables():
-    """Create all database tables."""
+    """Create all database tables and apply schema upgrades to existing ones."""
     async with engine.begin() as conn:
+        # The trigram index on trends.title needs pg_trgm before create_all runs
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+        for statement in _SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
 
 
 async def get_db() -> AsyncSession:
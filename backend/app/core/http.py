@@ -0,0 +1,48 @@
+"""
+Shared outbound HTTP client.
+"""
+
+from typing import AsyncIterator, Optional
+
+import httpx
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client.
+
+    The client speaks HTTP/2, so concurrent requests to the same host are
+    multiplexed over one connection that lives for the whole process.
+
+    Returns:
+        Async HTTP client
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=15.0,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class AsyncByteReader:
+    """Expose an async byte iterator through the ``read()`` API ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson accepts chunks of any length; an empty read marks EOF
+        return await anext(self._chunks, b"")
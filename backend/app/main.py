@@ -10,6 +10,7 @@ import structlog
 from app.core.config import settings
 from app.api.api_v1.api import api_router
 from app.core.database import create_tables
+from app.core.http import close_http_client
 
 # Configure structured logging
 structlog.configure(
@@ -71,6 +72,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on application shutdown."""
     logger.info("Shutting down PR Campaign Ideation System")
+    await close_http_client()
 
 
 @app.get("/")
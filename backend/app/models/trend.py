@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, String, Float, Integer, DateTime, Text, Boolean
+from sqlalchemy import Column, String, Float, Integer, DateTime, Text, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -19,6 +19,15 @@ class Trend(Base):
     Model for storing trending topics with their metadata and analysis.
     """
     __tablename__ = "trends"
+    __table_args__ = (
+        # Trigram index for fuzzy title matching during deduplication (needs pg_trgm)
+        Index(
+            "ix_trends_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -34,6 +43,21 @@ class Trend(Base):
     volume = Column(Integer, nullable=False, default=0)  # Total mentions/searches
     sentiment_score = Column(Float, nullable=True)  # -1 to 1
     sustainability_score = Column(Float, nullable=False, default=0.0, index=True)
+    pr_potential_score = Column(Float, nullable=True, index=True)  # 0 to 100, from advanced scoring
+    viral_potential_score = Column(Float, nullable=True, index=True)  # 0 to 100
+    brand_safety_score = Column(Float, nullable=True)  # 0 to 100
+    
+    # Enrichment signals used by scoring, flattened from trend_metadata
+    related_news_count = Column(Integer, nullable=True)
+    volume_change_24h = Column(Float, nullable=True)  # Search volume change, percent
+    volume_change_7d = Column(Float, nullable=True)
+    positive_pct = Column(Float, nullable=True)  # Sentiment distribution, percent
+    negative_pct = Column(Float, nullable=True)
+    age_groups_count = Column(Integer, nullable=True)
+    countries_count = Column(Integer, nullable=True)
+    opportunity_score = Column(Float, nullable=True)  # 0 to 100
+    emotional_indicators = Column(ARRAY(String), nullable=True)  # ["excitement", "curiosity"]
+    risk_factors = Column(ARRAY(String), nullable=True)
     
     # Source information
     platforms = Column(ARRAY(String), nullable=False, default=list)  # ["twitter", "google", "reddit"]
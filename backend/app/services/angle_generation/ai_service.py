@@ -3,20 +3,107 @@ AI service for trend analysis and campaign generation.
 Supports OpenRouter, OpenAI, and Anthropic providers.
 """
 
-from typing import List, Dict, Any, Optional
-import json
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, Optional, Callable
+import hashlib
 import asyncio
-import aiohttp
+import orjson
 import structlog
 from openai import AsyncOpenAI
 from anthropic import AsyncAnthropic
 
+from ...core.cache import get_redis
 from ...core.config import settings
 from ...models.trend import Trend
 
 logger = structlog.get_logger()
 
 
+def _trend_cache_key(namespace: str, trend: Trend) -> str:
+    """Build the AI response cache key for a trend from the model and its identifying fields."""
+    payload = orjson.dumps({
+        "title": trend.title,
+        "keywords": sorted(trend.keywords or []),
+        "category": trend.category,
+    })
+    digest = hashlib.sha256(settings.DEFAULT_AI_MODEL.encode() + payload).hexdigest()
+    return f"ai:{namespace}:{digest}"
+
+
+# Cache key -> future for AI calls currently running, so concurrent identical
+# calls share one LLM round trip. Resolves to _NO_RESULT if the call failed.
+_inflight_requests: Dict[str, asyncio.Future] = {}
+_NO_RESULT = object()
+
+
+def _cached_trend_response(namespace: str, is_cacheable: Callable[[Any], bool]):
+    """
+    Cache an AIService trend method's result in Redis.
+    
+    Results are keyed on the model and the trend's title, keywords and
+    category, so re-scoring the same trend skips the LLM round trip.
+    Concurrent calls with the same key wait for the first one instead of
+    issuing their own. Cache errors are treated as misses.
+    
+    Args:
+        namespace: Key prefix separating the wrapped methods
+        is_cacheable: Predicate rejecting results that should not be stored,
+            such as heuristic fallbacks from a failed AI call
+    """
+    def decorator(func):
+        async def cached_call(self, trend: Trend, key: str):
+            try:
+                cached = await get_redis().get(key)
+                if cached:
+                    return orjson.loads(cached)
+            except Exception as e:
+                logger.warning("AI response cache read failed", namespace=namespace, error=str(e))
+            
+            result = await func(self, trend)
+            if is_cacheable(result):
+                try:
+                    await get_redis().set(key, orjson.dumps(result), ex=settings.AI_RESPONSE_CACHE_TTL_SECONDS)
+                except Exception as e:
+                    logger.warning("AI response cache write failed", namespace=namespace, error=str(e))
+            return result
+        
+        @wraps(func)
+        async def wrapper(self, trend: Trend):
+            if not self.providers:
+                return await func(self, trend)
+            
+            key = _trend_cache_key(namespace, trend)
+            inflight = _inflight_requests.get(key)
+            if inflight is not None:
+                # Shielded so a cancelled waiter does not cancel the shared call
+                result = await asyncio.shield(inflight)
+                if result is not _NO_RESULT:
+                    return result
+                return await func(self, trend)
+            
+            future = asyncio.get_running_loop().create_future()
+            _inflight_requests[key] = future
+            result = _NO_RESULT
+            try:
+                result = await cached_call(self, trend, key)
+                return result
+            finally:
+                del _inflight_requests[key]
+                future.set_result(result)
+        return wrapper
+    return decorator
+
+
+def _is_ai_sustainability_analysis(result: Dict[str, Any]) -> bool:
+    """Whether a sustainability analysis came from the AI rather than the heuristic fallback."""
+    return isinstance(result, dict) and result.get('method') != 'fallback_heuristic'
+
+
+def _is_ai_campaign_ideas(result: List[Dict[str, Any]]) -> bool:
+    """Whether campaign ideas came from the AI rather than the template fallback."""
+    return bool(result) and all(idea.get('model') == 'ai-generated' for idea in result)
+
+
 class AIProvider:
     """Base class for AI providers."""
     
@@ -220,6 +307,7 @@ class AIService:
         
         return model
     
+    @_cached_trend_response("sustainability", _is_ai_sustainability_analysis)
     async def analyze_trend_sustainability(self, trend: Trend) -> Dict[str, Any]:
         """
         Analyze trend sustainability using AI.
@@ -247,8 +335,7 @@ class AIService:
                     
                     Title: {trend.title}
                     Description: {trend.description or 'No description'}
-                    Source: {trend.source}
-                    Platforms: {', '.join(trend.platforms)}
+                    Platforms: {', '.join(trend.platforms or [])}
                     Current Score: {trend.score}
                     Keywords: {', '.join(trend.keywords) if trend.keywords else 'None'}
                     
@@ -279,9 +366,9 @@ class AIService:
             
             # Parse JSON response
             try:
-                result = json.loads(response)
+                result = orjson.loads(response)
                 return result
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning("Failed to parse AI response as JSON", response=response)
                 return self._fallback_sustainability_analysis(trend)
             
@@ -314,6 +401,7 @@ class AIService:
             'risk_factors': [kw for kw in unsafe_keywords if kw in title_lower]
         }
     
+    @_cached_trend_response("campaign_ideas", _is_ai_campaign_ideas)
     async def generate_campaign_ideas(self, trend: Trend) -> List[Dict[str, Any]]:
         """
         Generate campaign ideas for a trend using AI and fallback templates.
@@ -353,8 +441,7 @@ class AIService:
                 
                 Title: {trend.title}
                 Description: {trend.description or 'No description available'}
-                Source: {trend.source}
-                Platforms: {', '.join(trend.platforms)}
+                Platforms: {', '.join(trend.platforms or [])}
                 Current Score: {trend.score}
                 Keywords: {', '.join(trend.keywords) if trend.keywords else 'None'}
                 
@@ -397,7 +484,7 @@ class AIService:
         )
         
         try:
-            result = json.loads(response)
+            result = orjson.loads(response)
             campaigns = result.get("campaigns", [])
             
             # Validate and enrich each campaign
@@ -410,7 +497,7 @@ class AIService:
             
             return validated_campaigns
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("Failed to parse AI campaign response", error=str(e), response=response)
             return []
     
@@ -543,4 +630,18 @@ class AIService:
             'pr_potential': 'high' if sustainability_score > 0.7 else 'medium',
             'safety_notes': 'Automated heuristic analysis',
             'method': 'fallback_heuristic'
-        } 
\ No newline at end of file
+        }
+
+
+@lru_cache
+def get_ai_service() -> AIService:
+    """
+    Get the process-wide AI service.
+    
+    Provider SDK clients (and their connection pools) are built once and
+    reused by every caller. Usable directly or as a FastAPI dependency.
+    
+    Returns:
+        Shared AIService instance
+    """
+    return AIService()
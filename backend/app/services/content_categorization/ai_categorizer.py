@@ -2,12 +2,17 @@
 AI-powered content categorization service for brand safety.
 """
 
+import asyncio
+import hashlib
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
+import orjson
 import structlog
 from pydantic import BaseModel
 from enum import Enum
 
-from app.services.angle_generation.ai_service import AIService
+from app.services.angle_generation.ai_service import AIService, get_ai_service
+from app.core.cache import get_redis
 from app.core.config import settings
 
 logger = structlog.get_logger()
@@ -24,6 +29,16 @@ class ContentSafetyLevel(Enum):
     BLOCKED = "blocked"
 
 
+# Value -> member lookup, avoids Enum.__call__ on every categorization
+_SAFETY_BY_VALUE = {level.value: level for level in ContentSafetyLevel}
+
+
+def _categorization_cache_key(title: str, description: str) -> str:
+    """Build the cache key for a post's AI categorization from its text."""
+    text = f"{title}|{description or ''}"[:4096]
+    return f"categorize:{hashlib.blake2b(text.encode(), digest_size=16).hexdigest()}"
+
+
 class ContentCategory(BaseModel):
     """Content categorization result."""
     safety_level: ContentSafetyLevel
@@ -38,9 +53,14 @@ class ContentCategory(BaseModel):
 class AIContentCategorizer:
     """AI-powered content categorizer for brand safety."""
     
-    def __init__(self):
-        """Initialize the AI categorizer."""
-        self.ai_service = AIService()
+    def __init__(self, ai_service: Optional[AIService] = None):
+        """
+        Initialize the AI categorizer.
+        
+        Args:
+            ai_service: AI service to use, defaults to the shared instance
+        """
+        self.ai_service = ai_service or get_ai_service()
         
     async def categorize_content(
         self, 
@@ -78,14 +98,17 @@ class AIContentCategorizer:
                     is_brand_safe=False
                 )
             
-            # Use AI for nuanced categorization
-            ai_result = await self._ai_categorize(title, description, subreddit, metadata_signals)
+            # Use AI for nuanced categorization, reusing a cached verdict for the same text
+            cache_key = _categorization_cache_key(title, description)
+            ai_result = (await self._get_cached_results([cache_key]))[0]
+            if ai_result is None:
+                ai_result = await self._ai_categorize(title, description, subreddit, metadata_signals)
+                await self._cache_results({cache_key: ai_result})
             
             # Combine AI analysis with metadata signals
             final_category = self._combine_signals(ai_result, metadata_signals)
             
             logger.info("Content categorized", 
-                       title=title[:50], 
                        safety_level=final_category.safety_level.value,
                        confidence=final_category.confidence)
             
@@ -104,6 +127,71 @@ class AIContentCategorizer:
                 is_brand_safe=False
             )
     
+    async def categorize_batch(self, items: List[Dict[str, Any]]) -> List[ContentCategory]:
+        """
+        Categorize many posts, sending several posts per AI prompt.
+        
+        Args:
+            items: Dicts with the categorize_content arguments
+                (title, description, subreddit, reddit_metadata)
+            
+        Returns:
+            ContentCategory per item, in input order
+        """
+        results: List[Optional[ContentCategory]] = [None] * len(items)
+        pending = []
+        
+        for index, item in enumerate(items):
+            metadata_signals = self._extract_metadata_signals(item.get('reddit_metadata') or {})
+            immediate_block = self._check_immediate_blocks(
+                item['title'], item.get('description', ''), item.get('subreddit', ''), metadata_signals
+            )
+            if immediate_block:
+                results[index] = ContentCategory(
+                    safety_level=ContentSafetyLevel.BLOCKED,
+                    confidence=1.0,
+                    primary_category="auto_blocked",
+                    secondary_categories=[],
+                    reasoning=f"Automatically blocked: {immediate_block}",
+                    metadata_signals=metadata_signals,
+                    is_brand_safe=False
+                )
+            else:
+                pending.append((index, item, metadata_signals))
+        
+        # Posts seen on an earlier run reuse their cached AI verdict
+        cache_keys = [
+            _categorization_cache_key(item['title'], item.get('description', ''))
+            for _, item, _ in pending
+        ]
+        cached_results = await self._get_cached_results(cache_keys)
+        misses = []
+        for (index, item, metadata_signals), cache_key, ai_result in zip(pending, cache_keys, cached_results):
+            if ai_result is None:
+                misses.append((index, item, metadata_signals, cache_key))
+            else:
+                results[index] = self._combine_signals(ai_result, metadata_signals)
+        pending = [(index, item, metadata_signals) for index, item, metadata_signals, _ in misses]
+        miss_keys = {index: cache_key for index, _, _, cache_key in misses}
+        
+        # Chunks are independent prompts, so send them concurrently
+        batch_size = max(1, settings.AI_CATEGORIZATION_BATCH_SIZE)
+        chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        chunk_results = await asyncio.gather(*[self._ai_categorize_chunk(chunk) for chunk in chunks])
+        
+        new_results = {}
+        for chunk, ai_results in zip(chunks, chunk_results):
+            for (index, _, metadata_signals), ai_result in zip(chunk, ai_results):
+                results[index] = self._combine_signals(ai_result, metadata_signals)
+                new_results[miss_keys[index]] = ai_result
+        await self._cache_results(new_results)
+        
+        logger.info("Content batch categorized",
+                   count=len(items),
+                   cache_hits=len(cache_keys) - len(misses),
+                   prompts=len(chunks))
+        return results
+    
     def _extract_metadata_signals(self, reddit_metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant signals from Reddit metadata."""
         signals = {}
@@ -187,15 +275,18 @@ class AIContentCategorizer:
                 {"role": "user", "content": prompt}
             ]
             
-            response = await self.ai_service.generate_with_fallback(
-                messages=messages,
-                max_tokens=300,
-                temperature=0.1  # Low temperature for consistent categorization
+            # Bounded, so a stalled provider falls back instead of holding up the batch
+            response = await asyncio.wait_for(
+                self.ai_service.generate_with_fallback(
+                    messages=messages,
+                    max_tokens=300,
+                    temperature=0.1  # Low temperature for consistent categorization
+                ),
+                timeout=settings.AI_CATEGORIZATION_TIMEOUT
             )
             
             # Parse JSON response
-            import json
-            result = json.loads(response.strip())
+            result = orjson.loads(response.strip())
             return result
             
         except Exception as e:
@@ -207,9 +298,83 @@ class AIContentCategorizer:
                 "primary_category": "unknown",
                 "secondary_categories": [],
                 "reasoning": f"AI analysis failed: {str(e)}",
-                "pr_suitability": "Unknown - manual review needed"
+                "pr_suitability": "Unknown - manual review needed",
+                "is_fallback": True
             }
     
+    async def _ai_categorize_chunk(self, chunk: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Categorize a chunk of posts with a single AI prompt.
+        
+        Falls back to one prompt per post if the batched response
+        cannot be matched back to the posts.
+        """
+        items_text = "\n\n".join(
+            f"[{position}] Title: {item['title']}\n"
+            f"Description: {item.get('description', '')[:300]}\n"
+            f"Subreddit: r/{item.get('subreddit', '')}\n"
+            f"Metadata: {metadata_signals}"
+            for position, (_, item, metadata_signals) in enumerate(chunk, 1)
+        )
+        prompt = settings.AI_CATEGORIZATION_BATCH_PROMPT_TEMPLATE.format(
+            count=len(chunk),
+            items=items_text
+        )
+        
+        try:
+            messages = [
+                {"role": "system", "content": settings.AI_CATEGORIZATION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ]
+            
+            response = await asyncio.wait_for(
+                self.ai_service.generate_with_fallback(
+                    messages=messages,
+                    max_tokens=300 * len(chunk),
+                    temperature=0.1  # Low temperature for consistent categorization
+                ),
+                timeout=settings.AI_CATEGORIZATION_TIMEOUT
+            )
+            
+            results = orjson.loads(response.strip())
+            if isinstance(results, list) and len(results) == len(chunk):
+                return results
+            logger.warning("Batch categorization returned mismatched results", expected=len(chunk))
+            
+        except Exception as e:
+            logger.warning("Batch AI categorization failed", error=str(e), size=len(chunk))
+        
+        return await asyncio.gather(*[
+            self._ai_categorize(
+                item['title'], item.get('description', ''), item.get('subreddit', ''), metadata_signals
+            )
+            for _, item, metadata_signals in chunk
+        ])
+    
+    async def _get_cached_results(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get cached AI results for the given keys, treating cache errors as misses."""
+        if not keys:
+            return []
+        try:
+            values = await get_redis().mget(keys)
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.warning("Categorization cache read failed", error=str(e))
+            return [None] * len(keys)
+    
+    async def _cache_results(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """Cache AI results by key, skipping fallbacks from failed AI calls."""
+        results = {key: result for key, result in results.items() if isinstance(result, dict) and not result.get('is_fallback')}
+        if not results:
+            return
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for key, result in results.items():
+                    pipe.set(key, orjson.dumps(result), ex=settings.AI_CATEGORIZATION_CACHE_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Categorization cache write failed", error=str(e))
+    
     def _combine_signals(
         self, 
         ai_result: Dict[str, Any], 
@@ -218,8 +383,8 @@ class AIContentCategorizer:
         """Combine AI analysis with metadata signals for final categorization."""
         
         try:
-            # Parse AI result
-            safety_level = ContentSafetyLevel(ai_result.get('safety_level', 'caution').lower())
+            # Parse AI result; an unknown label raises into the not-brand-safe error path
+            safety_level = _SAFETY_BY_VALUE[str(ai_result.get('safety_level', 'caution')).lower()]
             confidence = float(ai_result.get('confidence', 0.5))
             
             # Adjust confidence based on metadata signals
@@ -257,4 +422,15 @@ class AIContentCategorizer:
                 reasoning=f"Analysis error: {str(e)}",
                 metadata_signals=metadata_signals,
                 is_brand_safe=False
-            ) 
\ No newline at end of file
+            )
+
+
+@lru_cache
+def get_categorizer() -> AIContentCategorizer:
+    """
+    Get the process-wide content categorizer.
+    
+    Returns:
+        Shared AIContentCategorizer instance
+    """
+    return AIContentCategorizer()
@@ -1,40 +1,61 @@
 """Data enrichment service for enhancing trend data with additional context."""
 
 import asyncio
+import hashlib
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import aiohttp
-from sqlalchemy.ext.asyncio import AsyncSession
+import ijson
+import orjson
 
+from ...core.cache import get_redis
+from ...core.http import AsyncByteReader, get_http_client
 from ...core.config import settings
 from ...models.trend import Trend
-from ...schemas.trend import TrendUpdate
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of related news articles kept per trend
+RELATED_NEWS_LIMIT = 10
+
 class DataEnrichmentService:
     """Service for enriching trend data with additional context and insights."""
     
-    def __init__(self, session: AsyncSession):
-        self.session = session
+    def __init__(self):
         self.newsapi_key = settings.NEWS_API_KEY
         self.google_api_key = settings.GOOGLE_API_KEY
         
-    async def enrich_trend(self, trend: Trend) -> Trend:
+    async def enrich_trend(
+        self,
+        trend: Trend,
+        now_iso: Optional[str] = None,
+        from_date: Optional[str] = None,
+    ) -> Trend:
         """
         Enrich a trend with additional data from multiple sources.
         
         Args:
             trend: Trend object to enrich
+            now_iso: Enrichment timestamp, computed per call if not given
+            from_date: Earliest news date (YYYY-MM-DD), computed per call if not given
             
         Returns:
             Enriched trend object
         """
+        now_iso = now_iso or datetime.utcnow().isoformat()
+        cache_key = self._enrichment_cache_key(trend.title, now_iso)
+        
         try:
+            # Same title within the same hour: reuse the previous enrichment
+            cached = await self._get_cached_enrichment(cache_key)
+            if cached is not None:
+                await self._apply_enrichment(trend, cached)
+                return trend
+            
             # Gather enrichment data from multiple sources
             enrichment_tasks = [
-                self._get_related_news(trend.title),
+                self._get_related_news(trend.title, from_date),
                 self._get_search_volume_data(trend.title),
                 self._get_demographic_data(trend.title),
                 self._get_geographic_distribution(trend.title),
@@ -60,55 +81,109 @@ class DataEnrichmentService:
                 "geographic_distribution": geography,
                 "sentiment_analysis": sentiment,
                 "competition_analysis": competition,
-                "enriched_at": datetime.utcnow().isoformat(),
+                "enriched_at": now_iso,
             }
             
-            # Merge with existing metadata
-            if trend.metadata:
-                trend.metadata.update(enrichment_data)
-            else:
-                trend.metadata = enrichment_data
-            
-            # Update sustainability score based on enriched data
-            trend.sustainability_score = await self._calculate_sustainability_score(
-                trend, enrichment_data
-            )
+            await self._apply_enrichment(trend, enrichment_data)
+            await self._cache_enrichment(cache_key, enrichment_data)
             
             return trend
             
         except Exception as e:
-            logger.error(f"Error enriching trend {trend.id}: {e}")
+            logger.error("Error enriching trend %s: %s", trend.id, e)
             return trend
     
-    async def _get_related_news(self, query: str) -> List[Dict[str, Any]]:
+    async def _apply_enrichment(self, trend: Trend, enrichment_data: Dict[str, Any]) -> None:
+        """
+        Merge enrichment data into a trend and refresh its sustainability score.
+        
+        Args:
+            trend: Trend object to update
+            enrichment_data: Enriched data dictionary
+        """
+        # Assign a new dict so the JSONB column change is tracked
+        trend.trend_metadata = {**(trend.trend_metadata or {}), **enrichment_data}
+        
+        # Flat copies of the signals scoring reads, so it needs no JSON walks
+        search_volume = enrichment_data.get("search_volume") or {}
+        sentiment = enrichment_data.get("sentiment_analysis") or {}
+        sentiment_distribution = sentiment.get("sentiment_distribution", {})
+        trend.related_news_count = len(enrichment_data.get("related_news") or [])
+        trend.volume_change_24h = search_volume.get("volume_change_24h", 0)
+        trend.volume_change_7d = search_volume.get("volume_change_7d", 0)
+        trend.sentiment_score = sentiment.get("sentiment_score", trend.sentiment_score)
+        trend.positive_pct = sentiment_distribution.get("positive", 50)
+        trend.negative_pct = sentiment_distribution.get("negative", 0)
+        trend.emotional_indicators = list(sentiment.get("emotional_indicators", []))
+        trend.risk_factors = list(sentiment.get("risk_factors", []))
+        trend.age_groups_count = len((enrichment_data.get("demographics") or {}).get("age_groups", {}))
+        trend.countries_count = len((enrichment_data.get("geographic_distribution") or {}).get("top_countries", []))
+        trend.opportunity_score = (enrichment_data.get("competition_analysis") or {}).get("opportunity_score", 50)
+        
+        # Update sustainability score based on enriched data
+        trend.sustainability_score = await self._calculate_sustainability_score(
+            trend, enrichment_data
+        )
+    
+    def _enrichment_cache_key(self, title: str, now_iso: str) -> str:
+        """Build the cache key for a trend title in the hour of ``now_iso``."""
+        title_hash = hashlib.sha1(title.lower().encode()).hexdigest()
+        # ISO timestamp prefix "YYYY-MM-DDTHH" is the hour bucket
+        return f"enrich:{title_hash}:{now_iso[:13]}"
+    
+    async def _get_cached_enrichment(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get cached enrichment data, treating cache errors as a miss."""
+        try:
+            cached = await get_redis().get(key)
+            return orjson.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning("Enrichment cache read failed for %s: %s", key, e)
+            return None
+    
+    async def _cache_enrichment(self, key: str, enrichment_data: Dict[str, Any]) -> None:
+        """Store enrichment data in the cache, ignoring cache errors."""
+        try:
+            await get_redis().set(
+                key, orjson.dumps(enrichment_data), ex=settings.CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning("Enrichment cache write failed for %s: %s", key, e)
+    
+    async def _get_related_news(
+        self, query: str, from_date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """Get related news articles for a trend."""
+        from_date = from_date or (datetime.utcnow() - timedelta(days=7)).strftime("%Y-%m-%d")
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://newsapi.org/v2/everything"
-                params = {
-                    "q": query,
-                    "apiKey": self.newsapi_key,
-                    "sortBy": "relevancy",
-                    "pageSize": 10,
-                    "language": "en",
-                    "from": (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d"),
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return [
-                            {
-                                "title": article["title"],
-                                "description": article["description"],
-                                "url": article["url"],
-                                "published_at": article["publishedAt"],
-                                "source": article["source"]["name"],
-                            }
-                            for article in data.get("articles", [])
-                        ]
+            url = "https://newsapi.org/v2/everything"
+            params = {
+                "q": query,
+                "apiKey": self.newsapi_key,
+                "sortBy": "relevancy",
+                "pageSize": RELATED_NEWS_LIMIT,
+                "language": "en",
+                "from": from_date,
+            }
+            
+            async with get_http_client().stream("GET", url, params=params) as response:
+                if response.status_code == 200:
+                    # Stream articles off the socket and stop once we have enough
+                    articles = []
+                    async for article in ijson.items_async(
+                        AsyncByteReader(response.aiter_bytes()), "articles.item"
+                    ):
+                        articles.append({
+                            "title": article["title"],
+                            "description": article["description"],
+                            "url": article["url"],
+                            "published_at": article["publishedAt"],
+                            "source": article["source"]["name"],
+                        })
+                        if len(articles) >= RELATED_NEWS_LIMIT:
+                            break
+                    return articles
         except Exception as e:
-            logger.error(f"Error fetching related news for {query}: {e}")
+            logger.error("Error fetching related news for %s: %s", query, e)
         
         return []
     
@@ -130,7 +205,7 @@ class DataEnrichmentService:
                 ]
             }
         except Exception as e:
-            logger.error(f"Error fetching search volume for {query}: {e}")
+            logger.error("Error fetching search volume for %s: %s", query, e)
             return {}
     
     async def _get_demographic_data(self, query: str) -> Dict[str, Any]:
@@ -157,7 +232,7 @@ class DataEnrichmentService:
                 ]
             }
         except Exception as e:
-            logger.error(f"Error fetching demographics for {query}: {e}")
+            logger.error("Error fetching demographics for %s: %s", query, e)
             return {}
     
     async def _get_geographic_distribution(self, query: str) -> Dict[str, Any]:
@@ -180,7 +255,7 @@ class DataEnrichmentService:
                 ]
             }
         except Exception as e:
-            logger.error(f"Error fetching geography for {query}: {e}")
+            logger.error("Error fetching geography for %s: %s", query, e)
             return {}
     
     async def _get_sentiment_analysis(self, query: str) -> Dict[str, Any]:
@@ -206,7 +281,7 @@ class DataEnrichmentService:
                 ]
             }
         except Exception as e:
-            logger.error(f"Error analyzing sentiment for {query}: {e}")
+            logger.error("Error analyzing sentiment for %s: %s", query, e)
             return {}
     
     async def _get_competition_analysis(self, query: str) -> Dict[str, Any]:
@@ -229,7 +304,7 @@ class DataEnrichmentService:
                 "recommended_positioning": "thought leadership"
             }
         except Exception as e:
-            logger.error(f"Error analyzing competition for {query}: {e}")
+            logger.error("Error analyzing competition for %s: %s", query, e)
             return {}
     
     async def _calculate_sustainability_score(
@@ -284,7 +359,7 @@ class DataEnrichmentService:
             return min(100.0, max(0.0, score))
             
         except Exception as e:
-            logger.error(f"Error calculating sustainability score: {e}")
+            logger.error("Error calculating sustainability score: %s", e)
             return trend.sustainability_score or 50.0
     
     async def batch_enrich_trends(self, trends: List[Trend]) -> List[Trend]:
@@ -298,7 +373,15 @@ class DataEnrichmentService:
             List of enriched trends
         """
         try:
-            enrichment_tasks = [self.enrich_trend(trend) for trend in trends]
+            # Timestamps are shared by the whole batch
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+            from_date = (now - timedelta(days=7)).strftime("%Y-%m-%d")
+            
+            enrichment_tasks = [
+                self.enrich_trend(trend, now_iso=now_iso, from_date=from_date)
+                for trend in trends
+            ]
             enriched_trends = await asyncio.gather(*enrichment_tasks, return_exceptions=True)
             
             # Filter out any failed enrichments
@@ -310,5 +393,19 @@ class DataEnrichmentService:
             return successful_enrichments
             
         except Exception as e:
-            logger.error(f"Error in batch enrichment: {e}")
-            return trends 
\ No newline at end of file
+            logger.error("Error in batch enrichment: %s", e)
+            return trends
+
+
+@lru_cache
+def get_enrichment_service() -> DataEnrichmentService:
+    """
+    Get the process-wide data enrichment service.
+    
+    The service holds no database state; callers pass their own session
+    where one is needed.
+    
+    Returns:
+        Shared DataEnrichmentService instance
+    """
+    return DataEnrichmentService()
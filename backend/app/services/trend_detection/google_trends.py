@@ -2,19 +2,35 @@
 Google Trends service for collecting trending topics.
 """
 
+import asyncio
+import threading
 from typing import List, Dict, Any
 import structlog
 from pytrends.request import TrendReq
 
 logger = structlog.get_logger()
 
+# One client per process: TrendReq fetches Google cookies when constructed,
+# so building it per service instance repeats that round trip. It is created
+# on first use so an unreachable Google fails that fetch, not the import.
+# pytrends keeps per-request state on the instance, so calls are serialized
+# with a lock.
+_pytrends = None
+_pytrends_lock = threading.Lock()
+
 
 class GoogleTrendsService:
     """Service for collecting trends from Google Trends."""
     
-    def __init__(self):
-        """Initialize Google Trends service."""
-        self.pytrends = TrendReq(hl='en-US', tz=360)
+    def _fetch_trending_searches(self, geo: str):
+        """Fetch trending searches, serialized on the shared pytrends client."""
+        global _pytrends
+        with _pytrends_lock:
+            if _pytrends is None:
+                # No retries/backoff_factor: pytrends builds its urllib3 Retry with
+                # method_whitelist, which urllib3 2.x rejects
+                _pytrends = TrendReq(hl='en-US', tz=360)
+            return _pytrends.trending_searches(pn=geo)
     
     async def get_trending_topics(self, geo: str = 'US') -> List[Dict[str, Any]]:
         """
@@ -27,8 +43,8 @@ class GoogleTrendsService:
             List of trend dictionaries
         """
         try:
-            # Get trending searches
-            trending_searches = self.pytrends.trending_searches(pn=geo)
+            # Get trending searches; pytrends is blocking, so keep it off the event loop
+            trending_searches = await asyncio.to_thread(self._fetch_trending_searches, geo)
             
             trends = []
             for idx, topic in enumerate(trending_searches[0][:20]):  # Top 20
@@ -2,6 +2,7 @@
 News API service for collecting trending news topics.
 """
 
+import asyncio
 from typing import List, Dict, Any
 import structlog
 from newsapi import NewsApiClient
@@ -32,8 +33,10 @@ class NewsAPIService:
             return []
         
         try:
-            # Get top headlines
-            headlines = self.client.get_top_headlines(country=country, page_size=20)
+            # Get top headlines; the client is blocking, so keep it off the event loop
+            headlines = await asyncio.to_thread(
+                self.client.get_top_headlines, country=country, page_size=20
+            )
             
             trends = []
             for idx, article in enumerate(headlines.get('articles', [])):
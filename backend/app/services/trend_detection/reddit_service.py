@@ -2,39 +2,170 @@
 Reddit service for collecting trending topics.
 """
 
-from typing import List, Dict, Any
+import heapq
+import re
+import threading
+import time
+from operator import itemgetter
+from typing import List, Dict, Any, Optional
 import structlog
-import praw
+import aiohttp
+import asyncpraw
 import asyncio
+import numpy as np
 from app.core.config import settings
-from app.services.content_categorization.ai_categorizer import AIContentCategorizer, ContentSafetyLevel
+from app.services.content_categorization.ai_categorizer import ContentSafetyLevel, get_categorizer
 
 logger = structlog.get_logger()
 
+# Per-post debug logs build title previews, so only emit them when enabled
+_DEBUG_LOGS = settings.LOG_LEVEL.upper() == "DEBUG"
+
+# Trending score weights per algorithm:
+# (base score, upvote ratio, engagement, time decay, awards)
+_SCORE_WEIGHTS = {
+    # Hot algorithm: Balance recency, score, and engagement
+    "hot": (0.4, 0.2, 0.2, 0.15, 0.05),
+    # Top algorithm: Emphasize score and awards
+    "top": (0.6, 0.2, 0.1, 0.0, 0.1),
+    # Rising algorithm: Emphasize recent rapid growth
+    "rising": (0.3, 0.2, 0.2, 0.25, 0.05),
+    # New algorithm: Emphasize recency and initial engagement
+    "new": (0.2, 0.3, 0.2, 0.3, 0.0),
+}
+
+# Title keyword tokens: words of four or more letters
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z']{3,}")
+
+# Common English words that carry no topic signal
+_STOPWORDS = frozenset({
+    'about', 'after', 'again', 'also', 'been', 'before', 'being', 'both',
+    'could', 'does', 'doing', 'down', 'each', 'even', 'every', 'from',
+    'have', 'having', 'here', 'into', 'just', 'like', 'made', 'make',
+    'many', 'more', 'most', 'much', 'must', 'only', 'other', 'over',
+    'said', 'same', 'should', 'some', 'such', 'than', 'that', 'their',
+    'them', 'then', 'there', 'these', 'they', 'this', 'those', 'through',
+    'under', 'very', 'want', 'were', 'what', 'when', 'where', 'which',
+    'while', 'will', 'with', 'would', 'your', "don't", "it's", "i'm",
+    "can't", "didn't", "doesn't", "isn't", "won't", "you're", "that's"
+})
+
+# Submission fields read by _snapshot_post without a default
+_REQUIRED_POST_FIELDS = frozenset({
+    'title', 'selftext', 'score', 'upvote_ratio', 'num_comments',
+    'created_utc', 'permalink', 'author', 'subreddit'
+})
+
+# Subreddits always dropped by the keyword filter
+_BLOCKED_SUBREDDITS = frozenset({
+    'politics', 'worldpolitics', 'conservative', 'liberal',
+    'the_donald', 'sandersforpresident', 'politicalhumor',
+    'combatfootage', 'ukraine', 'russia', 'war'
+})
+
+# Safety levels that are never included
+_UNSAFE_LEVELS = frozenset({
+    ContentSafetyLevel.BLOCKED,
+    ContentSafetyLevel.VIOLENT,
+    ContentSafetyLevel.NSFW,
+    ContentSafetyLevel.POLITICAL
+})
+
+
+def _compile_keyword_filter() -> Optional[re.Pattern]:
+    """
+    Compile the configured filter keywords into one regex.
+    
+    Keywords are lowercased here and matched against the post's
+    lowercased text. Each keyword list becomes a named group so a
+    match still reports which list it came from.
+    
+    Returns:
+        Compiled pattern, or None if no keywords are configured
+    """
+    keyword_lists = {
+        'war': settings.CONTENT_FILTER_WAR_KEYWORDS,
+        'politics': settings.CONTENT_FILTER_POLITICS_KEYWORDS,
+        'violence': settings.CONTENT_FILTER_VIOLENCE_KEYWORDS,
+    }
+    groups = [
+        f"(?P<{name}>{'|'.join(re.escape(keyword.lower()) for keyword in keywords)})"
+        for name, keywords in keyword_lists.items()
+        if keywords
+    ]
+    return re.compile('|'.join(groups)) if groups else None
+
+
+_reddit_client: Optional[asyncpraw.Reddit] = None
+_reddit_loop: Optional[asyncio.AbstractEventLoop] = None
+_reddit_lock = threading.Lock()
+
+
+def get_reddit_client() -> Optional[asyncpraw.Reddit]:
+    """
+    Get the shared Reddit client for the running event loop.
+    
+    The client sits on one pooled aiohttp session, so Reddit API calls
+    reuse keep-alive connections across service instances. aiohttp
+    sessions are bound to an event loop, so a new client is created if
+    the loop has changed.
+    
+    Returns:
+        Reddit client, or None if credentials are not configured
+    """
+    global _reddit_client, _reddit_loop
+    
+    if not (settings.REDDIT_CLIENT_ID and settings.REDDIT_CLIENT_SECRET):
+        return None
+    
+    loop = asyncio.get_running_loop()
+    with _reddit_lock:
+        if _reddit_client is None or _reddit_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=16,
+                limit_per_host=8,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            _reddit_client = asyncpraw.Reddit(
+                client_id=settings.REDDIT_CLIENT_ID,
+                client_secret=settings.REDDIT_CLIENT_SECRET,
+                user_agent=settings.REDDIT_USER_AGENT,
+                requestor_kwargs={'session': aiohttp.ClientSession(connector=connector)}
+            )
+            _reddit_loop = loop
+        return _reddit_client
+
+
+async def close_reddit_client() -> None:
+    """Close the shared Reddit client and its HTTP session."""
+    global _reddit_client, _reddit_loop
+    
+    with _reddit_lock:
+        client, _reddit_client, _reddit_loop = _reddit_client, None, None
+    if client is not None:
+        await client.close()
+
 
 class RedditService:
     """Service for collecting trends from Reddit."""
     
     def __init__(self):
         """Initialize Reddit service."""
-        if settings.REDDIT_CLIENT_ID and settings.REDDIT_CLIENT_SECRET:
-            self.reddit = praw.Reddit(
-                client_id=settings.REDDIT_CLIENT_ID,
-                client_secret=settings.REDDIT_CLIENT_SECRET,
-                user_agent=settings.REDDIT_USER_AGENT
-            )
-        else:
-            self.reddit = None
+        self.reddit = get_reddit_client()
             
         # Initialize AI categorizer
-        self.ai_categorizer = AIContentCategorizer() if settings.AI_CATEGORIZATION_ENABLED else None
+        self.ai_categorizer = get_categorizer() if settings.AI_CATEGORIZATION_ENABLED else None
+        
+        # All filter keywords in a single pattern, scanned once per post
+        self._filter_re = _compile_keyword_filter()
     
     async def get_trending_topics(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Get trending topics from Reddit.
         
         Args:
-            limit: Number of posts to fetch
+            limit: Maximum number of trends to return
             
         Returns:
             List of trend dictionaries
@@ -44,9 +175,6 @@ class RedditService:
             return []
         
         try:
-            trends = []
-            filtered_count = 0
-            
             # Get configurable subreddits from settings
             subreddits = settings.REDDIT_SUBREDDITS
             posts_per_subreddit = settings.REDDIT_POSTS_PER_SUBREDDIT
@@ -58,104 +186,112 @@ class RedditService:
                        posts_per_sub=posts_per_subreddit,
                        ai_categorization_enabled=settings.AI_CATEGORIZATION_ENABLED)
             
-            for subreddit_name in subreddits:
+            # Subreddits are independent, so fetch them concurrently,
+            # with a cap to stay inside Reddit's rate limit
+            semaphore = asyncio.Semaphore(settings.REDDIT_MAX_CONCURRENCY)
+            
+            async def _bounded_fetch(name: str) -> List[Any]:
+                async with semaphore:
+                    return await self._fetch_subreddit(name, algorithm, posts_per_subreddit)
+            
+            results = await asyncio.gather(
+                *[_bounded_fetch(name) for name in subreddits],
+                return_exceptions=True
+            )
+            
+            listed = []
+            for subreddit_name, result in zip(subreddits, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to fetch from subreddit", subreddit=subreddit_name, error=str(result))
+                    continue
+                listed.extend(
+                    (post, subreddit_name, position) for position, post in enumerate(result, 1)
+                )
+            
+            # Fill in any partially loaded posts in bulk, then snapshot each post once
+            hydrated = await self._hydrate_posts([post for post, _, _ in listed])
+            candidates = []
+            for post, subreddit_name, position in listed:
+                post_data = self._snapshot_post(hydrated.get(post.fullname, post))
+                candidates.append(
+                    (post_data, subreddit_name, position, self._extract_reddit_metadata(post_data))
+                )
+            
+            filtered_count = 0
+            ai_enabled = settings.AI_CATEGORIZATION_ENABLED and self.ai_categorizer is not None
+            
+            # Cheap filtering runs first so filtered posts never reach the AI. With AI
+            # enabled only blocked subreddits are dropped here, as the AI rejects them
+            # anyway; keyword matching is kept as the fallback for a failed AI call.
+            if settings.CONTENT_FILTER_ENABLED:
+                prefilter = self._is_blocked_subreddit if ai_enabled else self._is_content_filtered
+                unfiltered = []
+                for candidate in candidates:
+                    if prefilter(candidate[0]):
+                        filtered_count += 1
+                        if _DEBUG_LOGS:
+                            logger.debug("Content filtered before AI", title=candidate[0]['title'][:50])
+                        continue
+                    unfiltered.append(candidate)
+                candidates = unfiltered
+            
+            # Categorize every remaining candidate in one batch rather than one post at a time
+            categories = [None] * len(candidates)
+            ai_failed = False
+            if ai_enabled and candidates:
                 try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-                    
-                    # Use configurable trending algorithm
-                    if algorithm == "hot":
-                        posts = subreddit.hot(limit=posts_per_subreddit)
-                    elif algorithm == "top":
-                        posts = subreddit.top(time_filter="day", limit=posts_per_subreddit)
-                    elif algorithm == "rising":
-                        posts = subreddit.rising(limit=posts_per_subreddit)
-                    elif algorithm == "new":
-                        posts = subreddit.new(limit=posts_per_subreddit)
-                    else:
-                        posts = subreddit.hot(limit=posts_per_subreddit)
-                    
-                    for idx, post in enumerate(posts):
-                        # Extract Reddit metadata
-                        reddit_metadata = self._extract_reddit_metadata(post)
-                        
-                        # Apply AI categorization
-                        content_category = None
-                        if settings.AI_CATEGORIZATION_ENABLED and self.ai_categorizer:
-                            try:
-                                content_category = await self.ai_categorizer.categorize_content(
-                                    title=post.title,
-                                    description=post.selftext[:500] if post.selftext else '',
-                                    subreddit=subreddit_name,
-                                    reddit_metadata=reddit_metadata
-                                )
-                                
-                                # Check if content should be filtered based on AI categorization
-                                if not self._should_include_content(content_category):
-                                    filtered_count += 1
-                                    logger.debug("Content filtered by AI", 
-                                               title=post.title[:50],
-                                               safety_level=content_category.safety_level.value,
-                                               confidence=content_category.confidence)
-                                    continue
-                                    
-                            except Exception as e:
-                                logger.warning("AI categorization failed", error=str(e), title=post.title[:50])
-                                # Fallback to keyword filtering if enabled
-                                if settings.FALLBACK_TO_KEYWORD_FILTER and settings.CONTENT_FILTER_ENABLED:
-                                    if self._is_content_filtered(post):
-                                        filtered_count += 1
-                                        logger.debug("Content filtered by fallback", title=post.title[:50])
-                                        continue
-                        
-                        # Fallback filtering for when AI categorization is disabled
-                        elif settings.CONTENT_FILTER_ENABLED:
-                            if self._is_content_filtered(post):
-                                filtered_count += 1
-                                logger.debug("Content filtered by keywords", title=post.title[:50])
-                                continue
-                        
-                        # Calculate enhanced trending score
-                        trending_score = self._calculate_trending_score(post, algorithm)
-                        
-                        # Build trend data with categorization results
-                        trend_data = {
-                            'title': post.title,
-                            'description': post.selftext[:200] if post.selftext else '',
-                            'category': subreddit_name,
-                            'score': trending_score,
-                            'velocity': max(0.1, min(1.0, post.upvote_ratio)),
-                            'volume': post.num_comments,
-                            'platforms': ['reddit'],
-                            'keywords': self._extract_keywords(post.title),
-                            'source_urls': [f"https://reddit.com{post.permalink}"],
-                            'metadata': {
-                                'subreddit': subreddit_name,
-                                'author': str(post.author) if post.author else 'deleted',
-                                'created_utc': post.created_utc,
-                                'num_comments': post.num_comments,
-                                'upvote_ratio': post.upvote_ratio,
-                                'reddit_score': post.score,
-                                'algorithm': algorithm,
-                                'awards_received': getattr(post, 'total_awards_received', 0),
-                                'is_original_content': getattr(post, 'is_original_content', False),
-                                'position_in_subreddit': idx + 1,
-                                'reddit_metadata': reddit_metadata,
-                                'ai_categorization': {
-                                    'safety_level': content_category.safety_level.value if content_category else None,
-                                    'confidence': content_category.confidence if content_category else None,
-                                    'primary_category': content_category.primary_category if content_category else None,
-                                    'reasoning': content_category.reasoning if content_category else None,
-                                    'is_brand_safe': content_category.is_brand_safe if content_category else None
-                                } if content_category else None
-                            }
+                    categories = await self.ai_categorizer.categorize_batch([
+                        {
+                            'title': post_data['title'],
+                            'description': post_data['selftext'][:500],
+                            'subreddit': subreddit_name,
+                            'reddit_metadata': reddit_metadata
                         }
-                        trends.append(trend_data)
-                        
+                        for post_data, subreddit_name, _, reddit_metadata in candidates
+                    ])
                 except Exception as e:
-                    logger.warning("Failed to fetch from subreddit", subreddit=subreddit_name, error=str(e))
+                    logger.warning("AI categorization failed", error=str(e), count=len(candidates))
+                    ai_failed = True
+            
+            # Fallback to keyword filtering if the AI call failed
+            keyword_fallback = (
+                ai_failed and settings.FALLBACK_TO_KEYWORD_FILTER and settings.CONTENT_FILTER_ENABLED
+            )
+            
+            kept = []
+            for (post_data, subreddit_name, position, reddit_metadata), content_category in zip(candidates, categories):
+                # Check if content should be filtered based on AI categorization
+                if content_category is not None and not self._should_include_content(content_category):
+                    filtered_count += 1
+                    if _DEBUG_LOGS:
+                        logger.debug("Content filtered by AI", 
+                                   title=post_data['title'][:50],
+                                   safety_level=content_category.safety_level.value,
+                                   confidence=content_category.confidence)
+                    continue
+                
+                if keyword_fallback and self._is_content_filtered(post_data):
+                    filtered_count += 1
+                    if _DEBUG_LOGS:
+                        logger.debug("Content filtered by fallback", title=post_data['title'][:50])
+                    continue
+                
+                kept.append((post_data, subreddit_name, position, reddit_metadata, content_category))
+            
+            # Score every kept post in one vectorized pass
+            trending_scores = self._calculate_trending_scores(
+                [post_data for post_data, *_ in kept], algorithm
+            )
+            trends = [
+                self._build_trend_data(
+                    post_data, subreddit_name, position, algorithm, reddit_metadata, content_category, trending_score
+                )
+                for (post_data, subreddit_name, position, reddit_metadata, content_category), trending_score
+                in zip(kept, trending_scores)
+            ]
             
-            # Sort trends by score (highest first)
-            trends.sort(key=lambda x: x['score'], reverse=True)
+            # Keep the top `limit` trends by score (highest first)
+            trends = heapq.nlargest(limit, trends, key=itemgetter('score'))
             
             logger.info("Collected Reddit trends", 
                        count=len(trends), 
@@ -167,109 +303,242 @@ class RedditService:
             logger.error("Failed to collect Reddit trends", error=str(e))
             return []
     
-    def _calculate_trending_score(self, post, algorithm: str) -> float:
+    async def _fetch_subreddit(
+        self, 
+        subreddit_name: str, 
+        algorithm: str, 
+        posts_per_subreddit: int
+    ) -> List[Any]:
+        """
+        Fetch candidate posts from a single subreddit.
+        
+        Args:
+            subreddit_name: Name of the subreddit to fetch
+            algorithm: Reddit listing to read (hot, top, rising or new)
+            posts_per_subreddit: Number of posts to fetch
+            
+        Returns:
+            Reddit post objects in listing order
+        """
+        subreddit = await self.reddit.subreddit(subreddit_name)
+        
+        # Use configurable trending algorithm
+        if algorithm == "hot":
+            posts = subreddit.hot(limit=posts_per_subreddit)
+        elif algorithm == "top":
+            posts = subreddit.top(time_filter="day", limit=posts_per_subreddit)
+        elif algorithm == "rising":
+            posts = subreddit.rising(limit=posts_per_subreddit)
+        elif algorithm == "new":
+            posts = subreddit.new(limit=posts_per_subreddit)
+        else:
+            posts = subreddit.hot(limit=posts_per_subreddit)
+        
+        return [post async for post in posts]
+    
+    async def _hydrate_posts(self, posts: List[Any]) -> Dict[str, Any]:
+        """
+        Load posts that are missing fields with bulk info requests.
+        
+        Listing results normally carry every field, but a partially loaded
+        post would otherwise fetch itself lazily on first attribute access.
+        Missing posts are loaded by fullname instead, 100 per request.
+        
+        Args:
+            posts: Reddit post objects
+            
+        Returns:
+            Fully loaded posts keyed by fullname, only for posts that needed it
+        """
+        fullnames = [
+            post.fullname for post in posts
+            if not _REQUIRED_POST_FIELDS.issubset(vars(post))
+        ]
+        if not fullnames:
+            return {}
+        
+        hydrated = {}
+        async for post in self.reddit.info(fullnames=fullnames):
+            hydrated[post.fullname] = post
+        
+        logger.info("Hydrated partial Reddit posts", requested=len(fullnames), loaded=len(hydrated))
+        return hydrated
+    
+    def _snapshot_post(self, post) -> Dict[str, Any]:
         """
-        Calculate enhanced trending score based on multiple factors.
+        Read every post attribute the service uses exactly once.
+        
+        Later steps work on the returned dict, so no step can trigger
+        a lazy Reddit fetch on the post object.
         
         Args:
             post: Reddit post object
+            
+        Returns:
+            Dictionary of post attributes
+        """
+        # Fetched fields live in the instance dict; reading them there skips
+        # the attribute protocol and can never trigger a lazy fetch
+        fields = vars(post)
+        author = post.author
+        title = post.title
+        selftext = post.selftext or ''
+        # Lowercase once; keyword filtering and extraction both reuse it
+        title_lc = title.lower()
+        return {
+            'title': title,
+            'selftext': selftext,
+            'title_lc': title_lc,
+            'content_lc': f"{title_lc} {selftext.lower()}",
+            'score': post.score,
+            'upvote_ratio': post.upvote_ratio,
+            'num_comments': post.num_comments,
+            'created_utc': post.created_utc,
+            'permalink': post.permalink,
+            'author': str(author) if author else 'deleted',
+            'subreddit': str(post.subreddit),
+            'total_awards_received': fields.get('total_awards_received', 0),
+            'is_original_content': fields.get('is_original_content', False),
+            'over_18': fields.get('over_18', False),
+            'locked': fields.get('locked', False),
+            'stickied': fields.get('stickied', False),
+            'gilded': fields.get('gilded', 0),
+            'link_flair_text': fields.get('link_flair_text', None),
+            'author_flair_text': fields.get('author_flair_text', None),
+            'is_video': fields.get('is_video', False),
+            'is_reddit_media_domain': fields.get('is_reddit_media_domain', False),
+            'domain': fields.get('domain', ''),
+        }
+    
+    def _build_trend_data(
+        self,
+        post_data: Dict[str, Any],
+        subreddit_name: str,
+        position: int,
+        algorithm: str,
+        reddit_metadata: Dict[str, Any],
+        content_category,
+        trending_score: float
+    ) -> Dict[str, Any]:
+        """Build the trend dictionary for a post that passed filtering."""
+        # Build trend data with categorization results
+        return {
+            'title': post_data['title'],
+            'description': post_data['selftext'][:200],
+            'category': subreddit_name,
+            'score': trending_score,
+            'velocity': max(0.1, min(1.0, post_data['upvote_ratio'])),
+            'volume': post_data['num_comments'],
+            'platforms': ['reddit'],
+            'keywords': self._extract_keywords(post_data['title_lc']),
+            'source_urls': [f"https://reddit.com{post_data['permalink']}"],
+            'metadata': {
+                'subreddit': subreddit_name,
+                'author': post_data['author'],
+                'created_utc': post_data['created_utc'],
+                'algorithm': algorithm,
+                'position_in_subreddit': position,
+                # Engagement counts, awards and OC flag live here only
+                'reddit_metadata': reddit_metadata,
+                'ai_categorization': {
+                    'safety_level': content_category.safety_level.value if content_category else None,
+                    'confidence': content_category.confidence if content_category else None,
+                    'primary_category': content_category.primary_category if content_category else None,
+                    'reasoning': content_category.reasoning if content_category else None,
+                    'is_brand_safe': content_category.is_brand_safe if content_category else None
+                } if content_category else None
+            }
+        }
+    
+    def _calculate_trending_scores(self, posts_data: List[Dict[str, Any]], algorithm: str) -> List[float]:
+        """
+        Calculate enhanced trending scores based on multiple factors.
+        
+        All posts share the algorithm and the current time, so the
+        scores are computed with one set of array operations.
+        
+        Args:
+            posts_data: Snapshots of the Reddit posts' attributes
             algorithm: Algorithm used to fetch posts
             
         Returns:
-            Normalized trending score (0.1-1.0)
+            Normalized trending scores (0.1-1.0), in input order
         """
+        if not posts_data:
+            return []
+        
+        scores = np.array([post_data['score'] for post_data in posts_data], dtype=np.float64)
+        
         try:
+            ratios = np.array([post_data['upvote_ratio'] for post_data in posts_data], dtype=np.float64)
+            num_comments = np.array([post_data['num_comments'] for post_data in posts_data], dtype=np.float64)
+            created = np.array([post_data['created_utc'] for post_data in posts_data], dtype=np.float64)
+            awards = np.array([post_data['total_awards_received'] for post_data in posts_data], dtype=np.float64)
+            
             # Base score from Reddit points (normalized)
-            base_score = max(0.1, min(1.0, post.score / 10000))
+            base_score = np.clip(scores / 10000, 0.1, 1.0)
             
             # Engagement ratio (comments per upvote)
-            engagement_ratio = 0.0
-            if post.score > 0:
-                engagement_ratio = min(1.0, post.num_comments / post.score)
+            engagement_ratio = np.where(
+                scores > 0, np.minimum(1.0, num_comments / np.maximum(scores, 1.0)), 0.0
+            )
             
-            # Time decay factor (newer posts get higher scores)
-            import time
-            current_time = time.time()
-            post_age_hours = (current_time - post.created_utc) / 3600
-            time_decay = max(0.1, 1.0 / (1.0 + post_age_hours / 24))  # Decay over 24 hours
+            # Time decay factor (newer posts get higher scores), decays over 24 hours
+            post_age_hours = (time.time() - created) / 3600
+            time_decay = np.maximum(0.1, 1.0 / (1.0 + post_age_hours / 24))
             
             # Awards factor (premium engagement)
-            awards_factor = min(1.0, getattr(post, 'total_awards_received', 0) / 10)
+            awards_factor = np.minimum(1.0, awards / 10)
             
             # Algorithm-specific weights
-            if algorithm == "hot":
-                # Hot algorithm: Balance recency, score, and engagement
-                trending_score = (
-                    base_score * 0.4 +
-                    post.upvote_ratio * 0.2 +
-                    engagement_ratio * 0.2 +
-                    time_decay * 0.15 +
-                    awards_factor * 0.05
-                )
-            elif algorithm == "top":
-                # Top algorithm: Emphasize score and awards
-                trending_score = (
-                    base_score * 0.6 +
-                    post.upvote_ratio * 0.2 +
-                    engagement_ratio * 0.1 +
-                    awards_factor * 0.1
-                )
-            elif algorithm == "rising":
-                # Rising algorithm: Emphasize recent rapid growth
-                trending_score = (
-                    base_score * 0.3 +
-                    post.upvote_ratio * 0.2 +
-                    engagement_ratio * 0.2 +
-                    time_decay * 0.25 +
-                    awards_factor * 0.05
-                )
-            else:  # new or default
-                # New algorithm: Emphasize recency and initial engagement
-                trending_score = (
-                    base_score * 0.2 +
-                    post.upvote_ratio * 0.3 +
-                    engagement_ratio * 0.2 +
-                    time_decay * 0.3
-                )
+            w_base, w_ratio, w_engagement, w_decay, w_awards = _SCORE_WEIGHTS.get(
+                algorithm, _SCORE_WEIGHTS["new"]
+            )
+            trending_scores = (
+                base_score * w_base +
+                ratios * w_ratio +
+                engagement_ratio * w_engagement +
+                time_decay * w_decay +
+                awards_factor * w_awards
+            )
             
-            return max(0.1, min(1.0, trending_score))
+            return np.clip(trending_scores, 0.1, 1.0).tolist()
             
         except Exception as e:
             logger.warning("Failed to calculate trending score", error=str(e))
-            return max(0.1, min(1.0, post.score / 10000))  # Fallback to simple score
+            return np.clip(scores / 10000, 0.1, 1.0).tolist()  # Fallback to simple score
     
-    def _extract_keywords(self, title: str) -> List[str]:
-        """Extract keywords from post title."""
-        # Simple keyword extraction
-        words = title.lower().split()
-        keywords = [word.strip('.,!?":;[]()') for word in words if len(word) > 3]
+    def _extract_keywords(self, title_lc: str) -> List[str]:
+        """Extract keywords from a lowercased post title."""
+        # Single regex pass over the title, skipping stopwords
+        keywords = [word for word in _WORD_RE.findall(title_lc) if word not in _STOPWORDS]
         return keywords[:5]
     
-    def _extract_reddit_metadata(self, post) -> Dict[str, Any]:
+    def _extract_reddit_metadata(self, post_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract comprehensive metadata from Reddit post."""
         metadata = {}
         
         # Basic post info
-        metadata['over_18'] = getattr(post, 'over_18', False)
-        metadata['locked'] = getattr(post, 'locked', False)
-        metadata['stickied'] = getattr(post, 'stickied', False)
-        metadata['gilded'] = getattr(post, 'gilded', 0)
-        metadata['awards_received'] = getattr(post, 'total_awards_received', 0)
+        metadata['over_18'] = post_data['over_18']
+        metadata['locked'] = post_data['locked']
+        metadata['stickied'] = post_data['stickied']
+        metadata['gilded'] = post_data['gilded']
+        metadata['awards_received'] = post_data['total_awards_received']
         
         # Flairs
-        metadata['link_flair_text'] = getattr(post, 'link_flair_text', None)
-        metadata['author_flair_text'] = getattr(post, 'author_flair_text', None)
+        metadata['link_flair_text'] = post_data['link_flair_text']
+        metadata['author_flair_text'] = post_data['author_flair_text']
         
         # Additional content indicators
-        metadata['is_video'] = getattr(post, 'is_video', False)
-        metadata['is_original_content'] = getattr(post, 'is_original_content', False)
-        metadata['is_reddit_media_domain'] = getattr(post, 'is_reddit_media_domain', False)
-        metadata['domain'] = getattr(post, 'domain', '')
+        metadata['is_video'] = post_data['is_video']
+        metadata['is_original_content'] = post_data['is_original_content']
+        metadata['is_reddit_media_domain'] = post_data['is_reddit_media_domain']
+        metadata['domain'] = post_data['domain']
         
         # Engagement metrics
-        metadata['score'] = post.score
-        metadata['upvote_ratio'] = post.upvote_ratio
-        metadata['num_comments'] = post.num_comments
+        metadata['score'] = post_data['score']
+        metadata['upvote_ratio'] = post_data['upvote_ratio']
+        metadata['num_comments'] = post_data['num_comments']
         
         return metadata
     
@@ -279,14 +548,7 @@ class RedditService:
             return True  # Include if categorization failed
             
         # Block unsafe content levels
-        unsafe_levels = {
-            ContentSafetyLevel.BLOCKED,
-            ContentSafetyLevel.VIOLENT, 
-            ContentSafetyLevel.NSFW,
-            ContentSafetyLevel.POLITICAL
-        }
-        
-        if content_category.safety_level in unsafe_levels:
+        if content_category.safety_level in _UNSAFE_LEVELS:
             return False
             
         # For controversial content, check confidence
@@ -300,57 +562,51 @@ class RedditService:
         # Include safe content
         return content_category.safety_level == ContentSafetyLevel.SAFE
     
-    def _is_content_filtered(self, post) -> bool:
+    def _is_content_filtered(self, post_data: Dict[str, Any]) -> bool:
         """
         Check if content should be filtered based on keywords.
         
         Args:
-            post: Reddit post object
+            post_data: Snapshot of the Reddit post's attributes
             
         Returns:
             True if content should be filtered, False otherwise
         """
         try:
-            # Combine title and description for filtering
-            content_text = (post.title + " " + (post.selftext or "")).lower()
-            
-            # Check war-related keywords
-            for keyword in settings.CONTENT_FILTER_WAR_KEYWORDS:
-                if keyword.lower() in content_text:
-                    logger.debug("Content filtered: war keyword found", 
-                               keyword=keyword, 
-                               title=post.title[:50])
-                    return True
-            
-            # Check politics-related keywords
-            for keyword in settings.CONTENT_FILTER_POLITICS_KEYWORDS:
-                if keyword.lower() in content_text:
-                    logger.debug("Content filtered: politics keyword found", 
-                               keyword=keyword, 
-                               title=post.title[:50])
-                    return True
-            
-            # Check violence-related keywords
-            for keyword in settings.CONTENT_FILTER_VIOLENCE_KEYWORDS:
-                if keyword.lower() in content_text:
-                    logger.debug("Content filtered: violence keyword found", 
-                               keyword=keyword, 
-                               title=post.title[:50])
-                    return True
-            
-            # Check subreddit-specific filtering
-            subreddit_name = str(post.subreddit).lower()
-            if subreddit_name in ['politics', 'worldpolitics', 'conservative', 'liberal', 
-                                 'the_donald', 'sandersforpresident', 'politicalhumor',
-                                 'combatfootage', 'ukraine', 'russia', 'war']:
-                logger.debug("Content filtered: restricted subreddit", 
-                           subreddit=subreddit_name, 
-                           title=post.title[:50])
+            # Check war, politics and violence keywords in one pass
+            # over the lowercased title and description
+            match = self._filter_re.search(post_data['content_lc']) if self._filter_re else None
+            if match:
+                if _DEBUG_LOGS:
+                    logger.debug("Content filtered by keyword", 
+                               category=match.lastgroup, 
+                               keyword=match.group(), 
+                               title=post_data['title'][:50])
                 return True
             
-            return False
+            # Check subreddit-specific filtering
+            return self._is_blocked_subreddit(post_data)
             
         except Exception as e:
             logger.warning("Error in content filtering", error=str(e))
             # When in doubt, don't filter - let content through
-            return False 
\ No newline at end of file
+            return False
+    
+    def _is_blocked_subreddit(self, post_data: Dict[str, Any]) -> bool:
+        """
+        Check if the post comes from a restricted subreddit.
+        
+        Args:
+            post_data: Snapshot of the Reddit post's attributes
+            
+        Returns:
+            True if the subreddit is blocked, False otherwise
+        """
+        subreddit_name = post_data['subreddit'].lower()
+        if subreddit_name in _BLOCKED_SUBREDDITS:
+            if _DEBUG_LOGS:
+                logger.debug("Content filtered: restricted subreddit", 
+                           subreddit=subreddit_name, 
+                           title=post_data['title'][:50])
+            return True
+        return False 
\ No newline at end of file
@@ -3,8 +3,17 @@ Celery application configuration for background tasks.
 """
 
 import asyncio
+import threading
+from typing import Optional
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+try:
+    import uvloop
+except ImportError:  # e.g. Windows; fall back to the default asyncio loop
+    uvloop = None
 
 from app.core.config import settings
 
@@ -22,16 +31,29 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack payloads are smaller and faster to (de)serialize than JSON;
+    # JSON is still accepted so messages queued before a deploy drain cleanly
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
+    # Trend payloads carry nested metadata and AI reasoning text; gzip keeps
+    # broker and result-backend entries small without an extra dependency
+    task_compression="gzip",
+    result_compression="gzip",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    # Defaults suit CPU-bound work; I/O workers override them on the command line
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    # Every task here spends its time waiting on APIs and the database, so
+    # all of them go to the "io" queue served by thread-pool workers
+    task_routes={
+        "app.tasks.*": {"queue": "io"},
+    },
 )
 
 # Scheduled tasks
@@ -59,19 +81,86 @@ celery_app.conf.beat_schedule = {
 }
 
 
+# Long-lived event loop for async task code, one per worker process.
+# Connection pools (database, Redis, HTTP, Reddit) are bound to the loop
+# that created them, so keeping one loop lets them survive across tasks.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the worker's background event loop, starting it if needed.
+    
+    Returns:
+        Running event loop
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="celery-async-loop", daemon=True
+            )
+            _loop_thread.start()
+        return _loop
+
+
+@worker_process_init.connect
+def _start_worker_loop(**kwargs):
+    """Start the background event loop when a prefork worker process boots."""
+    _ensure_loop()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_worker_loop(**kwargs):
+    """Close shared clients and stop the background event loop."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop, _loop_thread = None, None
+    if loop is None:
+        return
+    
+    from app.core.cache import close_redis
+    from app.core.database import engine
+    from app.core.http import close_http_client
+    from app.services.trend_detection.reddit_service import close_reddit_client
+    
+    async def _close_clients():
+        await close_reddit_client()
+        await close_http_client()
+        await close_redis()
+        await engine.dispose()
+    
+    try:
+        asyncio.run_coroutine_threadsafe(_close_clients(), loop).result(timeout=10)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        loop.close()
+
+
 def run_async_task(async_func):
     """
     Utility function to run async functions in Celery tasks.
     
+    The coroutine runs on the worker's persistent event loop rather
+    than a fresh loop per task. The wait is bounded by task_time_limit
+    because the threads pool does not enforce Celery's time limits.
+    
     Args:
         async_func: Async function to run
         
     Returns:
         Result of the async function
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    future = asyncio.run_coroutine_threadsafe(async_func, _ensure_loop())
     try:
-        return loop.run_until_complete(async_func)
-    finally:
-        loop.close() 
\ No newline at end of file
+        return future.result(timeout=celery_app.conf.task_time_limit)
+    except BaseException:
+        # e.g. TimeoutError: don't leave the coroutine running on the loop
+        future.cancel()
+        raise
@@ -5,20 +5,57 @@ Daily trend analysis tasks.
 import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
+import numpy as np
 import structlog
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, and_, bindparam, func, true, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import defer
 
 from app.tasks.celery_app import celery_app, run_async_task
+from app.core.config import settings
 from app.core.database import get_db_session
 from app.models.trend import Trend
 from app.models.campaign import Campaign
 from app.services.trend_detection.google_trends import GoogleTrendsService
 from app.services.trend_detection.news_api import NewsAPIService
 from app.services.trend_detection.reddit_service import RedditService
-from app.services.angle_generation.ai_service import AIService
+from app.services.angle_generation.ai_service import AIService, get_ai_service
 
 logger = structlog.get_logger()
 
+# Statements are built once; their compiled SQL is reused from the engine's cache
+# Deduplication only reads and updates the core columns; skip the JSON blobs
+_ACTIVE_TRENDS_SINCE_STMT = select(Trend).options(
+    defer(Trend.trend_metadata), defer(Trend.analysis_data)
+).where(
+    and_(
+        Trend.status == "active",
+        Trend.created_at >= bindparam("since")
+    )
+)
+_ARCHIVE_TRENDS_BEFORE_STMT = (
+    update(Trend)
+    .where(
+        and_(
+            Trend.created_at < bindparam("cutoff"),
+            Trend.status == "active"
+        )
+    )
+    .values(status="archived")
+    .execution_options(synchronize_session=False)
+)
+_ARCHIVE_CAMPAIGNS_BEFORE_STMT = (
+    update(Campaign)
+    .where(
+        and_(
+            Campaign.created_at < bindparam("cutoff"),
+            Campaign.status == "draft"
+        )
+    )
+    .values(status="archived")
+    .execution_options(synchronize_session=False)
+)
+
 
 @celery_app.task(bind=True, name="app.tasks.daily_analysis.analyze_daily_trends")
 def analyze_daily_trends(self):
@@ -51,34 +88,32 @@ async def _analyze_daily_trends_async() -> Dict[str, Any]:
         google_service = GoogleTrendsService()
         news_service = NewsAPIService()
         reddit_service = RedditService()
-        ai_service = AIService()
+        ai_service = get_ai_service()
         
-        # Collect trends from all sources
-        all_trends = []
+        # Collect trends from all sources concurrently, bounded by a semaphore
+        source_semaphore = asyncio.Semaphore(settings.TREND_SOURCE_MAX_CONCURRENCY)
         
-        # Google Trends
-        try:
-            google_trends = await google_service.get_trending_topics()
-            all_trends.extend(google_trends)
-            logger.info("Collected Google trends", count=len(google_trends))
-        except Exception as e:
-            logger.warning("Failed to collect Google trends", error=str(e))
+        async def _collect(service):
+            async with source_semaphore:
+                return await service.get_trending_topics()
         
-        # News API
-        try:
-            news_trends = await news_service.get_trending_topics()
-            all_trends.extend(news_trends)
-            logger.info("Collected news trends", count=len(news_trends))
-        except Exception as e:
-            logger.warning("Failed to collect news trends", error=str(e))
+        sources = {
+            "Google": google_service,
+            "news": news_service,
+            "Reddit": reddit_service,
+        }
+        results = await asyncio.gather(
+            *[_collect(service) for service in sources.values()],
+            return_exceptions=True
+        )
         
-        # Reddit
-        try:
-            reddit_trends = await reddit_service.get_trending_topics()
-            all_trends.extend(reddit_trends)
-            logger.info("Collected Reddit trends", count=len(reddit_trends))
-        except Exception as e:
-            logger.warning("Failed to collect Reddit trends", error=str(e))
+        all_trends = []
+        for source_name, result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to collect {source_name} trends", error=str(result))
+                continue
+            all_trends.extend(result)
+            logger.info(f"Collected {source_name} trends", count=len(result))
         
         # Process and deduplicate trends
         processed_trends = await _process_and_deduplicate_trends(all_trends, db)
@@ -121,46 +156,139 @@ async def _process_and_deduplicate_trends(
         List of processed Trend objects
     """
     processed_trends = []
+    new_rows = []
+    now = datetime.utcnow()
+    
+    since = now - timedelta(days=7)
+    
+    # Load recent active trends once and match against them in memory
+    result = await db.execute(_ACTIVE_TRENDS_SINCE_STMT, {"since": since})
+    known_trends = [(trend.title.lower(), trend) for trend in result.scalars()]
+    trends_by_id = {trend.id: trend for _, trend in known_trends}
+    # Title prefix -> trend, for the common exact-prefix case
+    prefix_index = {title_lc[:50]: trend for title_lc, trend in known_trends}
+    
+    # Titles that no recent trend contains fall back to trigram similarity,
+    # looked up for all of them in one indexed query
+    unmatched_needles = {
+        needle for needle in (trend_data['title'][:50].lower() for trend_data in raw_trends)
+        if needle not in prefix_index
+        and not any(needle in title_lc for title_lc, _ in known_trends)
+    }
+    similar_trends = {
+        needle: trends_by_id[trend_id]
+        for needle, trend_id in (await _find_similar_trends(db, unmatched_needles, since)).items()
+        if trend_id in trends_by_id
+    }
     
     for trend_data in raw_trends:
-        # Check if trend already exists (by title similarity)
-        existing_query = select(Trend).where(
-            and_(
-                Trend.title.ilike(f"%{trend_data['title'][:50]}%"),
-                Trend.status == "active",
-                Trend.created_at >= datetime.utcnow() - timedelta(days=7)
+        # Check if trend already exists (by title similarity): an existing
+        # title containing the first 50 characters of this one, or failing
+        # that, a sufficiently similar existing title
+        needle = trend_data['title'][:50].lower()
+        existing_trend = prefix_index.get(needle)
+        if existing_trend is None:
+            existing_trend = next(
+                (trend for title_lc, trend in known_trends if needle in title_lc),
+                None
             )
-        )
-        result = await db.execute(existing_query)
-        existing_trend = result.scalar_one_or_none()
+        if existing_trend is None:
+            existing_trend = similar_trends.get(needle)
         
-        if existing_trend:
-            # Update existing trend with new data
-            existing_trend.volume += trend_data.get('volume', 0)
-            existing_trend.platforms = list(set(existing_trend.platforms + trend_data.get('platforms', [])))
-            existing_trend.updated_at = datetime.utcnow()
+        if existing_trend is None:
+            # New trend: collect the row for one bulk insert after the loop
+            row = {
+                'title': trend_data['title'],
+                'description': trend_data.get('description'),
+                'category': trend_data.get('category'),
+                'score': trend_data.get('score', 0.0),
+                'velocity': trend_data.get('velocity', 0.0),
+                'volume': trend_data.get('volume', 0),
+                'platforms': trend_data.get('platforms', []),
+                'keywords': trend_data.get('keywords', []),
+                'source_urls': trend_data.get('source_urls', []),
+                'trend_metadata': trend_data.get('metadata', {}),
+                'first_seen_at': now
+            }
+            new_rows.append(row)
+            processed_trends.append(row)
+            
+            # Later items in this batch can match the new trend
+            title_lc = row['title'].lower()
+            known_trends.append((title_lc, row))
+            prefix_index.setdefault(title_lc[:50], row)
+        elif isinstance(existing_trend, dict):
+            # Matches a trend collected earlier in this batch, not yet inserted
+            existing_trend['volume'] += trend_data.get('volume', 0)
+            new_platforms = set(trend_data.get('platforms', ())).difference(existing_trend['platforms'])
+            if new_platforms:
+                existing_trend['platforms'] = [*existing_trend['platforms'], *new_platforms]
             processed_trends.append(existing_trend)
         else:
-            # Create new trend
-            trend = Trend(
-                title=trend_data['title'],
-                description=trend_data.get('description'),
-                category=trend_data.get('category'),
-                score=trend_data.get('score', 0.0),
-                velocity=trend_data.get('velocity', 0.0),
-                volume=trend_data.get('volume', 0),
-                platforms=trend_data.get('platforms', []),
-                keywords=trend_data.get('keywords', []),
-                source_urls=trend_data.get('source_urls', []),
-                metadata=trend_data.get('metadata', {}),
-                first_seen_at=datetime.utcnow()
-            )
-            db.add(trend)
-            processed_trends.append(trend)
+            # Update existing trend with new data; only touch the columns that
+            # change, so an unchanged trend is not written back at all
+            added_volume = trend_data.get('volume', 0)
+            new_platforms = set(trend_data.get('platforms', ())).difference(existing_trend.platforms)
+            if added_volume:
+                existing_trend.volume += added_volume
+            if new_platforms:
+                existing_trend.platforms = [*existing_trend.platforms, *new_platforms]
+            if added_volume or new_platforms:
+                existing_trend.updated_at = now
+            processed_trends.append(existing_trend)
+    
+    if new_rows:
+        # One multi-row INSERT ... RETURNING; the returned trends are
+        # persistent in the session, in the same order as new_rows
+        inserted = await db.scalars(
+            insert(Trend).returning(Trend, sort_by_parameter_order=True),
+            new_rows
+        )
+        trends_by_row = {id(row): trend for row, trend in zip(new_rows, inserted.all())}
+        processed_trends = [trends_by_row.get(id(item), item) for item in processed_trends]
     
     return processed_trends
 
 
+async def _find_similar_trends(db, needles, since: datetime) -> Dict[str, Any]:
+    """
+    Find the most similar recent active trend for each title.
+    
+    Uses pg_trgm similarity, served by the trigram index on trends.title.
+    
+    Args:
+        db: Database session
+        needles: Lowercased title prefixes to match
+        since: Only consider trends created after this time
+        
+    Returns:
+        Mapping of title prefix to matching trend ID, for prefixes with a match
+    """
+    if not needles:
+        return {}
+    
+    queries = func.unnest(
+        bindparam("needles", list(needles), type_=ARRAY(String))
+    ).table_valued("needle").render_derived()
+    similarity = func.similarity(Trend.title, queries.c.needle)
+    best_match = (
+        select(Trend.id)
+        .where(
+            Trend.status == "active",
+            Trend.created_at >= since,
+            Trend.title.op("%")(queries.c.needle),
+            similarity >= settings.TREND_DEDUP_SIMILARITY_THRESHOLD
+        )
+        .order_by(similarity.desc())
+        .limit(1)
+        .lateral()
+    )
+    result = await db.execute(
+        select(queries.c.needle, best_match.c.id).select_from(queries.join(best_match, true()))
+    )
+    return {needle: trend_id for needle, trend_id in result}
+
+
 async def _score_and_filter_trends(
     trends: List[Trend], 
     ai_service: AIService, 
@@ -178,39 +306,48 @@ async def _score_and_filter_trends(
         List of filtered trends
     """
     scored_trends = []
+    now = datetime.utcnow()
+    sem = asyncio.Semaphore(settings.AI_MAX_CONCURRENCY)
     
-    for trend in trends:
-        try:
-            # Calculate sustainability score using AI
-            sustainability_analysis = await ai_service.analyze_trend_sustainability(trend)
-            trend.sustainability_score = sustainability_analysis.get('score', 0.0)
-            trend.analysis_data = sustainability_analysis
-            
-            # Brand safety check
-            safety_check = await ai_service.check_brand_safety(trend)
-            trend.is_brand_safe = safety_check.get('is_safe', True)
-            
-            # Only keep trends that meet minimum criteria
-            if (trend.sustainability_score >= 0.3 and 
-                trend.score >= 0.2 and
-                trend.is_brand_safe):
-                trend.is_analyzed = True
-                trend.analyzed_at = datetime.utcnow()
-                scored_trends.append(trend)
-            else:
-                trend.status = "archived"
+    async def score_one(trend: Trend) -> None:
+        async with sem:
+            try:
+                # Sustainability and brand safety are independent LLM calls
+                sustainability_analysis, safety_check = await asyncio.gather(
+                    ai_service.analyze_trend_sustainability(trend),
+                    ai_service.check_brand_safety(trend)
+                )
+                trend.sustainability_score = sustainability_analysis.get('score', 0.0)
+                trend.analysis_data = sustainability_analysis
+                trend.is_brand_safe = safety_check.get('is_safe', True)
                 
-        except Exception as e:
-            logger.warning("Failed to score trend", trend_id=trend.id, error=str(e))
-            trend.status = "archived"
+                # Only keep trends that meet minimum criteria
+                if (trend.sustainability_score >= 0.3 and 
+                    trend.score >= 0.2 and
+                    trend.is_brand_safe):
+                    trend.is_analyzed = True
+                    trend.analyzed_at = now
+                    scored_trends.append(trend)
+                else:
+                    trend.status = "archived"
+                    
+            except Exception as e:
+                logger.warning("Failed to score trend", trend_id=trend.id, error=str(e))
+                trend.status = "archived"
+    
+    await asyncio.gather(*(score_one(trend) for trend in trends), return_exceptions=True)
+    
+    if not scored_trends:
+        return scored_trends
     
     # Sort by combined score (trend score + sustainability)
-    scored_trends.sort(
-        key=lambda t: (t.score * 0.6 + t.sustainability_score * 0.4), 
-        reverse=True
+    combined_scores = (
+        np.array([t.score for t in scored_trends]) * 0.6
+        + np.array([t.sustainability_score for t in scored_trends]) * 0.4
     )
+    order = np.argsort(-combined_scores, kind="stable")
     
-    return scored_trends
+    return [scored_trends[i] for i in order]
 
 
 async def _generate_campaign_angles(
@@ -229,15 +366,24 @@ async def _generate_campaign_angles(
     Returns:
         Number of campaigns generated
     """
-    campaigns_generated = 0
+    campaign_rows = []
+    sem = asyncio.Semaphore(settings.AI_MAX_CONCURRENCY)
+    
+    async def generate_one(trend: Trend) -> List[Dict[str, Any]]:
+        async with sem:
+            return await ai_service.generate_campaign_ideas(trend)
     
-    for trend in trends:
+    results = await asyncio.gather(
+        *(generate_one(trend) for trend in trends), return_exceptions=True
+    )
+    
+    # The session is not safe for concurrent use, so insert campaigns once all ideas are in
+    for trend, campaign_ideas in zip(trends, results):
         try:
-            # Generate campaign ideas
-            campaign_ideas = await ai_service.generate_campaign_ideas(trend)
-            
-            for idea in campaign_ideas:
-                campaign = Campaign(
+            if isinstance(campaign_ideas, BaseException):
+                raise campaign_ideas
+            trend_rows = [
+                dict(
                     trend_id=trend.id,
                     title=idea['title'],
                     headline=idea['headline'],
@@ -258,13 +404,17 @@ async def _generate_campaign_angles(
                     generation_model=idea.get('model', 'gpt-4'),
                     generation_metadata=idea.get('metadata', {})
                 )
-                db.add(campaign)
-                campaigns_generated += 1
-                
+                for idea in campaign_ideas
+            ]
+            campaign_rows.extend(trend_rows)
         except Exception as e:
             logger.warning("Failed to generate campaigns for trend", trend_id=trend.id, error=str(e))
     
-    return campaigns_generated
+    # One executemany INSERT for every generated campaign
+    if campaign_rows:
+        await db.execute(insert(Campaign), campaign_rows)
+    
+    return len(campaign_rows)
 
 
 @celery_app.task(bind=True, name="app.tasks.daily_analysis.cleanup_old_trends")
@@ -295,35 +445,12 @@ async def _cleanup_old_trends_async() -> Dict[str, int]:
     try:
         cutoff_date = datetime.utcnow() - timedelta(days=30)
         
-        # Archive old trends
-        old_trends_query = select(Trend).where(
-            and_(
-                Trend.created_at < cutoff_date,
-                Trend.status == "active"
-            )
-        )
-        result = await db.execute(old_trends_query)
-        old_trends = result.scalars().all()
-        
-        trends_archived = 0
-        for trend in old_trends:
-            trend.status = "archived"
-            trends_archived += 1
-        
-        # Archive old campaigns
-        old_campaigns_query = select(Campaign).where(
-            and_(
-                Campaign.created_at < cutoff_date,
-                Campaign.status == "draft"
-            )
-        )
-        result = await db.execute(old_campaigns_query)
-        old_campaigns = result.scalars().all()
+        # Archive old trends and campaigns in the database, without loading them
+        result = await db.execute(_ARCHIVE_TRENDS_BEFORE_STMT, {"cutoff": cutoff_date})
+        trends_archived = result.rowcount
         
-        campaigns_archived = 0
-        for campaign in old_campaigns:
-            campaign.status = "archived"
-            campaigns_archived += 1
+        result = await db.execute(_ARCHIVE_CAMPAIGNS_BEFORE_STMT, {"cutoff": cutoff_date})
+        campaigns_archived = result.rowcount
         
         await db.commit()
         
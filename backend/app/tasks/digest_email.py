@@ -1,6 +1,5 @@
 """Daily digest email generation and sending tasks."""
 
-import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -11,8 +10,8 @@ from jinja2 import Environment, BaseLoader
 from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .celery_app import celery_app
-from ..core.database import get_db_session
+from .celery_app import celery_app, run_async_task
+from ..core.database import AsyncSessionLocal
 from ..core.config import settings
 from ..models.trend import Trend
 from ..models.campaign import Campaign
@@ -119,7 +118,7 @@ def send_daily_digest(self, recipient_emails: List[str] = None):
         recipient_emails: Optional list of specific recipients
     """
     try:
-        return asyncio.run(_generate_and_send_digest(recipient_emails))
+        return run_async_task(_generate_and_send_digest(recipient_emails))
     except Exception as exc:
         logger.error(f"Daily digest sending failed: {exc}")
         raise self.retry(exc=exc, countdown=300)
@@ -135,7 +134,7 @@ async def _generate_and_send_digest(recipient_emails: List[str] = None) -> Dict[
         Send results summary
     """
     try:
-        async with get_db_session() as session:
+        async with AsyncSessionLocal() as session:
             # Gather digest data
             digest_data = await _gather_digest_data(session)
             
@@ -367,7 +366,7 @@ async def _log_digest_generation(
 def send_weekly_summary():
     """Send a weekly summary email with trend analytics."""
     try:
-        return asyncio.run(_send_weekly_summary())
+        return run_async_task(_send_weekly_summary())
     except Exception as exc:
         logger.error(f"Weekly summary sending failed: {exc}")
         raise
@@ -375,7 +374,7 @@ def send_weekly_summary():
 async def _send_weekly_summary() -> Dict[str, Any]:
     """Generate and send weekly summary email."""
     try:
-        async with get_db_session() as session:
+        async with AsyncSessionLocal() as session:
             # Get last week's data
             week_ago = datetime.utcnow() - timedelta(days=7)
             
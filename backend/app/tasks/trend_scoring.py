@@ -2,18 +2,53 @@
 
 import asyncio
 import logging
+import re
+import numpy as np
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, bindparam
 
-from .celery_app import celery_app
-from ..core.database import get_db_session
+from .celery_app import celery_app, run_async_task
+from ..core.database import AsyncSessionLocal
 from ..models.trend import Trend
-from ..services.data_enrichment.enrichment_service import DataEnrichmentService
+from ..services.data_enrichment.enrichment_service import (
+    DataEnrichmentService,
+    get_enrichment_service,
+)
 
 logger = logging.getLogger(__name__)
 
+# Title keyword scans, compiled once. Matching is by substring, as with `in`;
+# the lookahead lets overlapping controversial keywords each count.
+_VIRAL_STRONG_RE = re.compile("viral|trending|breaking|shocking|amazing")
+_VIRAL_MILD_RE = re.compile("new|latest|exclusive|first")
+_CONTROVERSIAL_RE = re.compile(
+    "(?=(scandal|controversy|lawsuit|arrest|banned|illegal|fraud|scam|fake|conspiracy))"
+)
+
+# Brand safety points deducted per sentiment risk factor (keys lowercase);
+# unlisted risk factors cost 10
+_RISK_DEDUCTIONS = {
+    "political sensitivity": 20,
+    "potential controversy": 15,
+    "adult content": 30,
+    "violence": 25,
+    "illegal activity": 40,
+    "hate speech": 35,
+    "misinformation": 25,
+}
+
+# Overall score weights, in column order: base score, sustainability,
+# PR potential, viral potential, brand safety
+_OVERALL_SCORE_WEIGHTS = np.array([0.25, 0.25, 0.20, 0.15, 0.15])
+
+# Built once; the compiled SQL is reused from the engine's cache
+_TRENDS_DUE_FOR_SCORING_STMT = select(Trend).where(
+    Trend.created_at >= bindparam("created_since"),
+    Trend.sustainability_score.is_(None) | 
+    (Trend.updated_at < bindparam("updated_before"))
+)
+
 @celery_app.task(bind=True, max_retries=3)
 def advanced_trend_scoring(self, trend_ids: List[str] = None):
     """
@@ -23,7 +58,7 @@ def advanced_trend_scoring(self, trend_ids: List[str] = None):
         trend_ids: Optional list of specific trend IDs to score
     """
     try:
-        return asyncio.run(_run_advanced_scoring(trend_ids))
+        return run_async_task(_run_advanced_scoring(trend_ids))
     except Exception as exc:
         logger.error(f"Advanced trend scoring failed: {exc}")
         raise self.retry(exc=exc, countdown=60)
@@ -39,28 +74,33 @@ async def _run_advanced_scoring(trend_ids: List[str] = None) -> Dict[str, Any]:
         Analysis results
     """
     try:
-        async with get_db_session() as session:
+        async with AsyncSessionLocal() as session:
+            now = datetime.utcnow()
+            
             # Get trends to analyze
             if trend_ids:
-                query = select(Trend).where(Trend.id.in_(trend_ids))
+                result = await session.execute(select(Trend).where(Trend.id.in_(trend_ids)))
             else:
                 # Score trends from last 24 hours that haven't been scored recently
-                cutoff_time = datetime.utcnow() - timedelta(hours=24)
-                query = select(Trend).where(
-                    Trend.created_at >= cutoff_time,
-                    Trend.sustainability_score.is_(None) | 
-                    (Trend.updated_at < datetime.utcnow() - timedelta(hours=6))
+                result = await session.execute(
+                    _TRENDS_DUE_FOR_SCORING_STMT,
+                    {
+                        "created_since": now - timedelta(hours=24),
+                        "updated_before": now - timedelta(hours=6),
+                    },
                 )
-            
-            result = await session.execute(query)
             trends = result.scalars().all()
             
             if not trends:
                 logger.info("No trends found for advanced scoring")
                 return {"processed": 0, "status": "no_trends"}
             
-            # Initialize enrichment service
-            enrichment_service = DataEnrichmentService(session)
+            # Scores are written back with one bulk UPDATE per batch, so stop
+            # tracking the loaded rows to keep autoflush from updating them again
+            session.expunge_all()
+            
+            # Shared enrichment service
+            enrichment_service = get_enrichment_service()
             
             # Process trends in batches
             batch_size = 10
@@ -70,11 +110,37 @@ async def _run_advanced_scoring(trend_ids: List[str] = None) -> Dict[str, Any]:
                 batch = trends[i:i + batch_size]
                 
                 # Calculate advanced scores for batch
-                scored_trends = await _calculate_advanced_scores(batch, enrichment_service)
+                scored_trends = await _calculate_advanced_scores(batch, enrichment_service, now)
                 
-                # Update trends in database
-                for trend in scored_trends:
-                    await session.merge(trend)
+                # Update trends in database, one executemany UPDATE by primary key
+                if scored_trends:
+                    await session.execute(
+                        update(Trend),
+                        [
+                            {
+                                "id": trend.id,
+                                "score": trend.score,
+                                "sustainability_score": trend.sustainability_score,
+                                "pr_potential_score": trend.pr_potential_score,
+                                "viral_potential_score": trend.viral_potential_score,
+                                "brand_safety_score": trend.brand_safety_score,
+                                "trend_metadata": trend.trend_metadata,
+                                "related_news_count": trend.related_news_count,
+                                "volume_change_24h": trend.volume_change_24h,
+                                "volume_change_7d": trend.volume_change_7d,
+                                "sentiment_score": trend.sentiment_score,
+                                "positive_pct": trend.positive_pct,
+                                "negative_pct": trend.negative_pct,
+                                "age_groups_count": trend.age_groups_count,
+                                "countries_count": trend.countries_count,
+                                "opportunity_score": trend.opportunity_score,
+                                "emotional_indicators": trend.emotional_indicators,
+                                "risk_factors": trend.risk_factors,
+                                "updated_at": trend.updated_at,
+                            }
+                            for trend in scored_trends
+                        ],
+                    )
                 
                 processed_count += len(scored_trends)
                 
@@ -94,7 +160,7 @@ async def _run_advanced_scoring(trend_ids: List[str] = None) -> Dict[str, Any]:
         raise
 
 async def _calculate_advanced_scores(
-    trends: List[Trend], enrichment_service: DataEnrichmentService
+    trends: List[Trend], enrichment_service: DataEnrichmentService, now: datetime
 ) -> List[Trend]:
     """
     Calculate advanced scores for a batch of trends.
@@ -102,16 +168,29 @@ async def _calculate_advanced_scores(
     Args:
         trends: List of trends to score
         enrichment_service: Data enrichment service instance
+        now: Scoring run timestamp, stored as each trend's updated_at
         
     Returns:
         List of trends with updated scores
     """
     scored_trends = []
+    fully_scored = []
+    now_iso = now.isoformat()
+    from_date = (now - timedelta(days=7)).strftime("%Y-%m-%d")
+    
+    # Enrich the whole batch concurrently; enrichment is the I/O-bound step
+    enriched = await asyncio.gather(
+        *(
+            enrichment_service.enrich_trend(trend, now_iso=now_iso, from_date=from_date)
+            for trend in trends
+        ),
+        return_exceptions=True
+    )
     
-    for trend in trends:
+    for trend, enriched_trend in zip(trends, enriched):
         try:
-            # Enrich trend with additional data
-            enriched_trend = await enrichment_service.enrich_trend(trend)
+            if isinstance(enriched_trend, BaseException):
+                raise enriched_trend
             
             # Calculate PR potential score
             pr_score = await _calculate_pr_potential(enriched_trend)
@@ -125,19 +204,23 @@ async def _calculate_advanced_scores(
             safety_score = await _calculate_brand_safety_score(enriched_trend)
             enriched_trend.brand_safety_score = safety_score
             
-            # Update overall score based on all factors
-            enriched_trend.score = await _calculate_overall_score(enriched_trend)
-            
             # Update timestamp
-            enriched_trend.updated_at = datetime.utcnow()
+            enriched_trend.updated_at = now
             
             scored_trends.append(enriched_trend)
+            fully_scored.append(enriched_trend)
             
         except Exception as e:
             logger.error(f"Error scoring trend {trend.id}: {e}")
             # Keep original trend if scoring fails
             scored_trends.append(trend)
     
+    # Update overall scores based on all factors, for the whole batch at once
+    if fully_scored:
+        overall_scores = _calculate_overall_scores(fully_scored)
+        for trend, overall_score in zip(fully_scored, overall_scores.tolist()):
+            trend.score = overall_score
+    
     return scored_trends
 
 async def _calculate_pr_potential(trend: Trend) -> float:
@@ -152,16 +235,13 @@ async def _calculate_pr_potential(trend: Trend) -> float:
     """
     try:
         score = 0.0
-        metadata = trend.trend_metadata or {}
         
         # News coverage factor (30% weight)
-        news_articles = metadata.get("related_news", [])
-        news_score = min(30, len(news_articles) * 3)
+        news_score = min(30, (trend.related_news_count or 0) * 3)
         score += news_score
         
         # Search volume trends (25% weight)
-        search_data = metadata.get("search_volume", {})
-        volume_change = search_data.get("volume_change_7d", 0)
+        volume_change = trend.volume_change_7d or 0
         if volume_change > 50:
             score += 25
         elif volume_change > 20:
@@ -170,19 +250,14 @@ async def _calculate_pr_potential(trend: Trend) -> float:
             score += 15
         
         # Sentiment analysis (20% weight)
-        sentiment_data = metadata.get("sentiment_analysis", {})
-        sentiment_score = sentiment_data.get("sentiment_score", 0)
-        positive_percentage = sentiment_data.get("sentiment_distribution", {}).get("positive", 50)
+        positive_percentage = 50 if trend.positive_pct is None else trend.positive_pct
         score += (positive_percentage / 100) * 20
         
         # Geographic reach (15% weight)
-        geo_data = metadata.get("geographic_distribution", {})
-        countries_count = len(geo_data.get("top_countries", []))
-        score += min(15, countries_count * 3)
+        score += min(15, (trend.countries_count or 0) * 3)
         
         # Competition analysis (10% weight)
-        competition_data = metadata.get("competition_analysis", {})
-        opportunity_score = competition_data.get("opportunity_score", 50)
+        opportunity_score = 50 if trend.opportunity_score is None else trend.opportunity_score
         score += (opportunity_score / 100) * 10
         
         return min(100.0, max(0.0, score))
@@ -203,11 +278,9 @@ async def _calculate_virality_potential(trend: Trend) -> float:
     """
     try:
         score = 0.0
-        metadata = trend.trend_metadata or {}
         
         # Engagement velocity (40% weight)
-        search_data = metadata.get("search_volume", {})
-        volume_change_24h = search_data.get("volume_change_24h", 0)
+        volume_change_24h = trend.volume_change_24h or 0
         if volume_change_24h > 100:
             score += 40
         elif volume_change_24h > 50:
@@ -218,18 +291,16 @@ async def _calculate_virality_potential(trend: Trend) -> float:
             score += 10
         
         # Demographic spread (25% weight)
-        demo_data = metadata.get("demographics", {})
-        age_groups = demo_data.get("age_groups", {})
-        if len(age_groups) >= 4:  # Multiple age groups engaged
+        age_groups_count = trend.age_groups_count or 0
+        if age_groups_count >= 4:  # Multiple age groups engaged
             score += 25
-        elif len(age_groups) >= 3:
+        elif age_groups_count >= 3:
             score += 20
-        elif len(age_groups) >= 2:
+        elif age_groups_count >= 2:
             score += 15
         
         # Emotional resonance (20% weight)
-        sentiment_data = metadata.get("sentiment_analysis", {})
-        emotional_indicators = sentiment_data.get("emotional_indicators", [])
+        emotional_indicators = trend.emotional_indicators or ()
         if "excitement" in emotional_indicators:
             score += 8
         if "curiosity" in emotional_indicators:
@@ -238,11 +309,10 @@ async def _calculate_virality_potential(trend: Trend) -> float:
             score += 6
         
         # Content shareability (15% weight)
-        if any(keyword in trend.title.lower() for keyword in 
-               ["viral", "trending", "breaking", "shocking", "amazing"]):
+        title_lc = trend.title.lower()
+        if _VIRAL_STRONG_RE.search(title_lc):
             score += 15
-        elif any(keyword in trend.title.lower() for keyword in 
-                 ["new", "latest", "exclusive", "first"]):
+        elif _VIRAL_MILD_RE.search(title_lc):
             score += 10
         
         return min(100.0, max(0.0, score))
@@ -263,30 +333,13 @@ async def _calculate_brand_safety_score(trend: Trend) -> float:
     """
     try:
         score = 100.0  # Start with perfect safety
-        metadata = trend.trend_metadata or {}
-        
-        # Check for risk factors
-        sentiment_data = metadata.get("sentiment_analysis", {})
-        risk_factors = sentiment_data.get("risk_factors", [])
         
         # Deduct points for each risk factor
-        risk_deductions = {
-            "political sensitivity": 20,
-            "potential controversy": 15,
-            "adult content": 30,
-            "violence": 25,
-            "illegal activity": 40,
-            "hate speech": 35,
-            "misinformation": 25,
-        }
-        
-        for risk_factor in risk_factors:
-            deduction = risk_deductions.get(risk_factor.lower(), 10)
-            score -= deduction
+        for risk_factor in trend.risk_factors or ():
+            score -= _RISK_DEDUCTIONS.get(risk_factor.lower(), 10)
         
         # Check sentiment distribution for negative sentiment
-        sentiment_dist = sentiment_data.get("sentiment_distribution", {})
-        negative_percentage = sentiment_dist.get("negative", 0)
+        negative_percentage = trend.negative_pct or 0
         if negative_percentage > 30:
             score -= 15
         elif negative_percentage > 20:
@@ -295,14 +348,8 @@ async def _calculate_brand_safety_score(trend: Trend) -> float:
             score -= 5
         
         # Check for controversial keywords in trend title
-        controversial_keywords = [
-            "scandal", "controversy", "lawsuit", "arrest", "banned",
-            "illegal", "fraud", "scam", "fake", "conspiracy"
-        ]
-        
-        for keyword in controversial_keywords:
-            if keyword in trend.title.lower():
-                score -= 10
+        found_keywords = {match.group(1) for match in _CONTROVERSIAL_RE.finditer(trend.title.lower())}
+        score -= 10 * len(found_keywords)
         
         return max(0.0, min(100.0, score))
         
@@ -310,52 +357,44 @@ async def _calculate_brand_safety_score(trend: Trend) -> float:
         logger.error(f"Error calculating brand safety score: {e}")
         return 75.0  # Default to moderately safe
 
-async def _calculate_overall_score(trend: Trend) -> float:
+def _calculate_overall_scores(trends: List[Trend]) -> np.ndarray:
     """
-    Calculate overall trend score based on all factors.
+    Calculate overall trend scores based on all factors.
     
     Args:
-        trend: Trend object with all scores calculated
+        trends: Trend objects with all scores calculated
         
     Returns:
-        Overall score (0-100)
+        Overall scores (0-100), one per trend
     """
-    try:
-        # Weight different score components
-        weights = {
-            "base_score": 0.25,  # Original trend score
-            "sustainability": 0.25,  # Long-term potential
-            "pr_potential": 0.20,  # PR campaign potential
-            "viral_potential": 0.15,  # Virality potential
-            "brand_safety": 0.15,  # Brand safety factor
-        }
-        
-        scores = {
-            "base_score": trend.score or 50.0,
-            "sustainability": trend.sustainability_score or 50.0,
-            "pr_potential": trend.pr_potential_score or 50.0,
-            "viral_potential": trend.viral_potential_score or 50.0,
-            "brand_safety": trend.brand_safety_score or 75.0,
-        }
-        
-        # Calculate weighted average
-        overall_score = sum(scores[key] * weights[key] for key in weights.keys())
-        
-        # Apply brand safety penalty if score is too low
-        if scores["brand_safety"] < 50:
-            overall_score *= 0.8  # 20% penalty for low safety
-        
-        return min(100.0, max(0.0, overall_score))
-        
-    except Exception as e:
-        logger.error(f"Error calculating overall score: {e}")
-        return 50.0
+    # Missing component scores count as neutral
+    components = np.array(
+        [
+            [
+                trend.score or 50.0,
+                trend.sustainability_score or 50.0,
+                trend.pr_potential_score or 50.0,
+                trend.viral_potential_score or 50.0,
+                trend.brand_safety_score or 75.0,
+            ]
+            for trend in trends
+        ],
+        dtype=np.float64,
+    )
+    
+    # Weighted average
+    overall_scores = components @ _OVERALL_SCORE_WEIGHTS
+    
+    # Apply brand safety penalty if score is too low (20% penalty)
+    overall_scores *= np.where(components[:, 4] < 50, 0.8, 1.0)
+    
+    return np.clip(overall_scores, 0.0, 100.0)
 
 @celery_app.task
 def trend_decay_analysis():
     """Analyze trend decay patterns and update relevance scores."""
     try:
-        return asyncio.run(_run_decay_analysis())
+        return run_async_task(_run_decay_analysis())
     except Exception as exc:
         logger.error(f"Trend decay analysis failed: {exc}")
         raise
@@ -363,27 +402,24 @@ def trend_decay_analysis():
 async def _run_decay_analysis() -> Dict[str, Any]:
     """Run trend decay analysis to identify declining trends."""
     try:
-        async with get_db_session() as session:
-            # Get trends older than 3 days
-            cutoff_time = datetime.utcnow() - timedelta(days=3)
-            query = select(Trend).where(Trend.created_at < cutoff_time)
-            
-            result = await session.execute(query)
-            trends = result.scalars().all()
-            
-            decayed_count = 0
+        async with AsyncSessionLocal() as session:
+            # Decay trends older than 3 days by 10% per day of age, in one statement
+            now = datetime.utcnow()
+            cutoff_time = now - timedelta(days=3)
+            age_days = func.extract("day", now - Trend.created_at)
+            decay_factor = func.greatest(0.1, 1.0 - age_days * 0.1)
             
-            for trend in trends:
-                # Calculate decay factor based on age
-                age_days = (datetime.utcnow() - trend.created_at).days
-                decay_factor = max(0.1, 1.0 - (age_days * 0.1))  # 10% decay per day
-                
-                # Apply decay to scores
-                trend.score *= decay_factor
-                trend.sustainability_score = (trend.sustainability_score or 50.0) * decay_factor
-                trend.pr_potential_score = (trend.pr_potential_score or 50.0) * decay_factor
-                
-                decayed_count += 1
+            result = await session.execute(
+                update(Trend)
+                .where(Trend.created_at < cutoff_time)
+                .values(
+                    score=Trend.score * decay_factor,
+                    sustainability_score=func.coalesce(Trend.sustainability_score, 50.0) * decay_factor,
+                    pr_potential_score=func.coalesce(Trend.pr_potential_score, 50.0) * decay_factor,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            decayed_count = result.rowcount
             
             await session.commit()
             
@@ -0,0 +1,38 @@
+"""
+Tests for the AI content categorizer.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.content_categorization.ai_categorizer import (
+    AIContentCategorizer,
+    ContentSafetyLevel,
+)
+
+
+@pytest.fixture
+def categorizer():
+    return AIContentCategorizer(ai_service=MagicMock())
+
+
+def test_combine_signals_unknown_label_is_not_brand_safe(categorizer):
+    category = categorizer._combine_signals(
+        {"safety_level": "hate_speech", "confidence": 0.95}, {}
+    )
+
+    assert category.safety_level == ContentSafetyLevel.CAUTION
+    assert category.confidence == 0.3
+    assert not category.is_brand_safe
+
+
+def test_combine_signals_known_label(categorizer):
+    category = categorizer._combine_signals(
+        {"safety_level": "SAFE", "confidence": 0.9, "primary_category": "technology"}, {}
+    )
+
+    assert category.safety_level == ContentSafetyLevel.SAFE
+    assert category.confidence == 0.9
+    assert category.primary_category == "technology"
+    assert category.is_brand_safe
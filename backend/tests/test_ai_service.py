@@ -0,0 +1,75 @@
+"""
+Tests for the AI service's trend response cache.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from app.core.config import settings
+from app.models.trend import Trend
+from app.services.angle_generation import ai_service as ai_service_module
+from app.services.angle_generation.ai_service import AIService
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(ai_service_module, "get_redis", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def ai_service(monkeypatch):
+    """AI service with one provider whose completions are mocked."""
+    for key in ("OPENROUTER_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY"):
+        monkeypatch.setattr(settings, key, None)
+    service = AIService()
+    service.providers = {"openrouter": MagicMock()}
+    service.generate_with_fallback = AsyncMock(return_value=orjson.dumps({
+        "score": 0.8,
+        "longevity": "medium",
+        "pr_potential": "high",
+        "safety_notes": "No concerns",
+        "recommended_timing": "This week",
+        "risk_factors": [],
+    }).decode())
+    return service
+
+
+@pytest.fixture
+def trend():
+    return Trend(
+        title="Solar eclipse viewing parties sell out",
+        description="Cities report record demand for eclipse events",
+        category="science",
+        score=0.8,
+        platforms=["google", "reddit"],
+        keywords=["solar", "eclipse", "viewing"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_analyze_trend_sustainability_second_call_is_cache_hit(ai_service, redis, trend):
+    first = await ai_service.analyze_trend_sustainability(trend)
+    second = await ai_service.analyze_trend_sustainability(trend)
+
+    assert first["score"] == 0.8
+    assert first.get("method") != "fallback_heuristic"
+    assert second == first
+    assert len(redis.store) == 1
+    ai_service.generate_with_fallback.assert_awaited_once()
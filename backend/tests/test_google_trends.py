@@ -0,0 +1,46 @@
+"""
+Tests for the Google Trends service.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytrends import request as pytrends_request
+
+from app.services.trend_detection import google_trends as google_trends_module
+from app.services.trend_detection.google_trends import GoogleTrendsService
+
+
+@pytest.fixture
+def http(monkeypatch):
+    """Patch the HTTP layer pytrends uses for its cookie and data requests."""
+    cookie_response = MagicMock()
+    cookie_response.cookies.items.return_value = [("NID", "cookie")]
+
+    data_response = MagicMock(status_code=200, text='{"US": ["solar eclipse", "world cup"]}')
+    data_response.headers = {"Content-Type": "application/json; charset=UTF-8"}
+    session = MagicMock()
+    session.get.return_value = data_response
+
+    monkeypatch.setattr(pytrends_request.requests, "get", MagicMock(return_value=cookie_response))
+    monkeypatch.setattr(pytrends_request.requests, "session", MagicMock(return_value=session))
+    # Build a fresh shared client against the patched HTTP layer
+    monkeypatch.setattr(google_trends_module, "_pytrends", None)
+    return session
+
+
+def test_fetch_trending_searches_builds_client(http):
+    searches = GoogleTrendsService()._fetch_trending_searches("US")
+
+    assert list(searches[0]) == ["solar eclipse", "world cup"]
+    http.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_trending_topics(http):
+    trends = await GoogleTrendsService().get_trending_topics(geo="US")
+
+    assert [trend["title"] for trend in trends] == ["solar eclipse", "world cup"]
+    assert trends[0]["score"] > trends[1]["score"]
+    assert trends[0]["platforms"] == ["google"]
+    assert trends[0]["metadata"] == {"geo": "US", "source": "google_trends", "rank": 1}
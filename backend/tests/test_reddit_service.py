@@ -0,0 +1,173 @@
+"""
+Tests for the Reddit trend detection service.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.services.trend_detection import reddit_service as reddit_module
+from app.services.trend_detection.reddit_service import RedditService
+
+
+def _submission(post_id, title, subreddit, score):
+    """Fake asyncpraw submission with every field the service reads."""
+    return SimpleNamespace(
+        fullname=f"t3_{post_id}",
+        title=title,
+        selftext="",
+        score=score,
+        upvote_ratio=0.9,
+        num_comments=40,
+        created_utc=time.time() - 3600,
+        permalink=f"/r/{subreddit}/comments/{post_id}/",
+        author="poster",
+        subreddit=subreddit,
+    )
+
+
+async def _listing(posts):
+    for post in posts:
+        yield post
+
+
+@pytest.fixture
+def subreddit_posts():
+    return {
+        "technology": [
+            _submission("a1", "Battery startup doubles range", "technology", 1000),
+            _submission("a2", "Open source robotics kit ships to schools", "technology", 9000),
+            _submission("a3", "Telescope captures distant galaxy", "technology", 5000),
+        ],
+        "politics": [
+            _submission("b1", "Weekly discussion thread", "politics", 50000),
+        ],
+    }
+
+
+@pytest.fixture
+def reddit_client(subreddit_posts):
+    """Reddit client whose subreddits serve the fake submissions as listings."""
+    def _subreddit(name):
+        subreddit = MagicMock()
+        subreddit.hot.side_effect = lambda limit: _listing(subreddit_posts[name][:limit])
+        return subreddit
+
+    client = MagicMock()
+    client.subreddit = AsyncMock(side_effect=_subreddit)
+    return client
+
+
+@pytest.fixture
+def reddit_service(monkeypatch, reddit_client):
+    """Reddit service with the Reddit client and AI categorizer mocked out."""
+    monkeypatch.setattr(reddit_module, "get_reddit_client", lambda: reddit_client)
+    monkeypatch.setattr(reddit_module, "get_categorizer", lambda: MagicMock())
+    monkeypatch.setattr(settings, "REDDIT_SUBREDDITS", ["technology", "politics"])
+    monkeypatch.setattr(settings, "REDDIT_POSTS_PER_SUBREDDIT", 5)
+    monkeypatch.setattr(settings, "REDDIT_TRENDING_ALGORITHM", "hot")
+    monkeypatch.setattr(settings, "CONTENT_FILTER_ENABLED", True)
+    return RedditService()
+
+
+def test_service_without_credentials(monkeypatch):
+    monkeypatch.setattr(settings, "REDDIT_CLIENT_ID", None)
+    monkeypatch.setattr(settings, "REDDIT_CLIENT_SECRET", None)
+    monkeypatch.setattr(reddit_module, "get_categorizer", lambda: MagicMock())
+
+    assert reddit_module.get_reddit_client() is None
+    assert RedditService().reddit is None
+
+
+@pytest.mark.asyncio
+async def test_get_trending_topics(reddit_service, monkeypatch):
+    monkeypatch.setattr(settings, "AI_CATEGORIZATION_ENABLED", False)
+
+    trends = await reddit_service.get_trending_topics(limit=2)
+
+    # The politics post scores highest but its subreddit is blocked
+    assert [trend["title"] for trend in trends] == [
+        "Open source robotics kit ships to schools",
+        "Telescope captures distant galaxy",
+    ]
+    assert trends[0]["score"] >= trends[1]["score"]
+    for trend in trends:
+        assert trend["category"] == "technology"
+        assert trend["platforms"] == ["reddit"]
+        assert trend["source_urls"][0].startswith("https://reddit.com/r/technology/comments/")
+        assert 0.1 <= trend["score"] <= 1.0
+        assert 0.1 <= trend["velocity"] <= 1.0
+        assert trend["volume"] == 40
+        assert trend["metadata"]["subreddit"] == "technology"
+        assert trend["metadata"]["algorithm"] == "hot"
+        assert trend["metadata"]["ai_categorization"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_trending_topics_leaves_keyword_filtering_to_ai(
+    reddit_service, subreddit_posts, monkeypatch
+):
+    monkeypatch.setattr(settings, "AI_CATEGORIZATION_ENABLED", True)
+    subreddit_posts["technology"].append(
+        _submission("a4", "New software release beats every deadline", "technology", 3000)
+    )
+    reddit_service.ai_categorizer = MagicMock()
+    reddit_service.ai_categorizer.categorize_batch = AsyncMock(
+        side_effect=lambda items: [None] * len(items)
+    )
+
+    trends = await reddit_service.get_trending_topics(limit=10)
+
+    # "software" contains "war" and "deadline" contains "dead", but only the
+    # blocked subreddit is dropped before the AI sees the posts
+    sent = reddit_service.ai_categorizer.categorize_batch.await_args.args[0]
+    assert {item["subreddit"] for item in sent} == {"technology"}
+    assert len(trends) == 4
+    assert "New software release beats every deadline" in [trend["title"] for trend in trends]
+
+
+def test_extract_keywords_skips_stopwords_and_short_words(reddit_service):
+    keywords = reddit_service._extract_keywords("this city will have the best summer festival")
+
+    assert keywords == ["city", "best", "summer", "festival"]
+
+
+def test_extract_keywords_returns_at_most_five(reddit_service):
+    keywords = reddit_service._extract_keywords(
+        "alpha bravo charlie delta echo foxtrot golf hotel"
+    )
+
+    assert keywords == ["alpha", "bravo", "charlie", "delta", "echo"]
+
+
+def test_content_filter_blocks_keywords(reddit_service):
+    post_data = {
+        "title": "Missile strike reported overnight",
+        "content_lc": "missile strike reported overnight ",
+        "subreddit": "news",
+    }
+
+    assert reddit_service._is_content_filtered(post_data)
+
+
+def test_content_filter_blocks_restricted_subreddits(reddit_service):
+    post_data = {
+        "title": "Weekly discussion thread",
+        "content_lc": "weekly discussion thread ",
+        "subreddit": "Politics",
+    }
+
+    assert reddit_service._is_content_filtered(post_data)
+
+
+def test_content_filter_allows_safe_content(reddit_service):
+    post_data = {
+        "title": "Museum unveils restored painting",
+        "content_lc": "museum unveils restored painting ",
+        "subreddit": "art",
+    }
+
+    assert not reddit_service._is_content_filtered(post_data)